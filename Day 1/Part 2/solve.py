@@ -3,14 +3,29 @@
 solve.py
 
 Usage:
-    python solve.py input.txt
+    python solve.py input.txt [--numpy | --parallel[=N] | --stream]
 
 Reads rotations (one per line, e.g. "L25" or "R1000") and prints:
  - Part 1: number of times the dial is at 0 after a rotation
  - Part 2: number of times the dial is at 0 during any click of the rotations
+
+--numpy parses the whole file into an int64 delta array and counts both
+parts with array operations (needs numpy); --parallel splits the file into
+byte ranges summarised by N worker processes (default: one per CPU);
+--stream memory-maps the file and computes both parts in one constant-memory
+scan.
+The answers are the same in every mode.
 """
 
+import mmap
+import os
 import sys
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
 
 def part1_count(rotations, start=50):
     pos = start
@@ -66,91 +81,204 @@ def part2_count(rotations, start=50):
 
     return total
 
-def read_file_lines(filename):
-    with open(filename, 'r', encoding='utf-8') as f:
-        return [line.rstrip('\n') for line in f]
+def parse_deltas(data):
+    """
+    Parse a whole rotation buffer (bytes) into a signed int64 array of deltas,
+    e.g. b"L25\nR1000" -> [-25, 1000], without a Python loop per line.
+    Every L/R starts a rotation; its digits are combined by place value.
+    """
+    buf = np.frombuffer(data.upper(), dtype=np.uint8)
+    is_digit = (buf >= ord('0')) & (buf <= ord('9'))
+    is_dir = (buf == ord('R')) | (buf == ord('L'))
+    # space, or one of \t \n \v \f \r (bytes 9-13)
+    ok = is_digit | is_dir
+    ok |= buf == ord(' ')
+    ok |= (buf >= 9) & (buf <= 13)
+    if not ok.all():
+        bad = int(np.argmin(ok))
+        raise ValueError(f"Bad instruction byte at offset {bad}: {data[bad:bad + 1]!r}")
+    del ok
 
-def main(argv):
-    if len(argv) < 2:
-        print("Usage: python solve.py input.txt")
-        return
-    filename = argv[1]
-    rotations = read_file_lines(filename)
-    p1 = part1_count(rotations)
-    p2 = part2_count(rotations)
-    print("Part 1 (count at end of rotations):", p1)
-    print("Part 2 (count during rotations):   ", p2)
+    # from here on memory is per rotation and per digit, not per byte
+    dir_pos = np.flatnonzero(is_dir)
+    digit_pos = np.flatnonzero(is_digit)
+    del is_dir, is_digit
+    n = dir_pos.size
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    # index of the first digit after each L/R; digits of one rotation are
+    # contiguous, so rotation i owns digits first[i] .. first[i+1]-1
+    first = np.searchsorted(digit_pos, dir_pos)
+    if first[0] > 0:
+        raise ValueError("Bad instruction: distance before the first L/R")
+    digits = buf[digit_pos] - ord('0')
+    del digit_pos
+    ndigits = np.diff(first, append=digits.size)
+    if (ndigits == 0).any():
+        raise ValueError("Bad instruction: L/R without a distance")
+    if ndigits.max() > 18:
+        raise ValueError("--numpy keeps distances in int64, so they must have at most 18 digits")
 
-if __name__ == "__main__":
-    main(sys.argv)
+    # Horner's rule, one digit place at a time for every rotation at once
+    dist = np.zeros(n, dtype=np.int64)
+    last = digits.size - 1
+    for k in range(int(ndigits.max())):
+        digit = digits[np.minimum(first + k, last)]
+        dist = np.where(ndigits > k, dist * 10 + digit, dist)
+    return np.where(buf[dir_pos] == ord('R'), dist, -dist)
 
-#!/usr/bin/env python3
-"""
-solve.py
+def part1_count_numpy(deltas, start=50):
+    """Vectorized part1_count: positions are a cumulative sum mod 100."""
+    pos = (start + np.cumsum(deltas)) % 100
+    return int(np.count_nonzero(pos == 0))
 
-Usage:
-    python solve.py input.txt
+def part2_count_numpy(deltas, start=50):
+    """
+    Vectorized part2_count: the same target_k formula, evaluated for every
+    rotation at once from the position before it.
+    """
+    if deltas.size == 0:
+        return 0
+    pos = np.empty_like(deltas)
+    pos[0] = start % 100
+    pos[1:] = (start + np.cumsum(deltas[:-1])) % 100
+    dist = np.abs(deltas)
 
-Reads rotations (one per line, e.g. "L25" or "R1000") and prints:
- - Part 1: number of times the dial is at 0 after a rotation
- - Part 2: number of times the dial is at 0 during any click of the rotations
-"""
+    target_k = np.where(deltas > 0, -pos, pos) % 100
+    target_k[target_k == 0] = 100
 
-import sys
+    hits = np.where(target_k <= dist, 1 + (dist - target_k) // 100, 0)
+    return int(hits.sum())
+
+def summarise_rotations(rotations):
+    """
+    Summarise a run of rotations independently of where the dial starts.
+
+    Returns (net, p1, p2): net is the total offset of the run mod 100 and
+    p1[s] / p2[s] are the part 1 / part 2 counts when the run starts at s.
+    With unwrapped positions a -> b a rotation R clicks through 0
+    floor(b/100) - floor(a/100) times, and L floor((a-1)/100) - floor((b-1)/100)
+    times. For s in 0..99, floor((s + c)/100) is c // 100 plus one once
+    s >= 100 - c % 100, so p2 is a base count plus a 100-entry step table.
+    """
+    net = 0
+    p1 = [0] * 100
+    base = 0
+    steps = [0] * 101
+
+    def floor_term(c, sign):
+        nonlocal base
+        base += sign * (c // 100)
+        if c % 100:
+            steps[100 - c % 100] += sign
 
-def part1_count(rotations, start=50):
-    pos = start
-    count = 0
     for line in rotations:
         line = line.strip()
         if not line:
             continue
         dir_ = line[0].upper()
         dist = int(line[1:])
+        prev = net
         if dir_ == 'L':
-            pos = (pos - dist) % 100
+            net -= dist
+            floor_term(prev - 1, 1)
+            floor_term(net - 1, -1)
         elif dir_ == 'R':
-            pos = (pos + dist) % 100
+            net += dist
+            floor_term(net, 1)
+            floor_term(prev, -1)
         else:
             raise ValueError(f"Bad instruction: {line}")
-        if pos == 0:
-            count += 1
-    return count
+        p1[-net % 100] += 1
 
-def part2_count(rotations, start=50):
+    p2 = []
+    for s in range(100):
+        base += steps[s]
+        p2.append(base)
+    return net % 100, p1, p2
+
+def read_chunk_lines(filename, start, end):
     """
-    Count number of times during the clicks of rotations (k = 1..dist) that pos becomes 0.
-    For a rotation with direction sgn (+1 for R, -1 for L) and starting pos,
-    we need k in 1..dist such that (pos + sgn * k) % 100 == 0.
-    Solve for k: k ≡ -sgn*pos (mod 100).
-    Let target_k = (-sgn*pos) % 100. If target_k == 0 then the first solution in positive k is 100.
-    If target_k > dist -> 0 occurrences. Otherwise occurrences = 1 + (dist - target_k) // 100.
+    Yield the lines whose first byte lies in [start, end), so byte ranges
+    cut anywhere still hand every line to exactly one chunk.
     """
-    pos = start
-    total = 0
-    for line in rotations:
-        line = line.strip()
-        if not line:
-            continue
-        dir_ = line[0].upper()
-        dist = int(line[1:])
-        sgn = 1 if dir_ == 'R' else -1
+    with open(filename, 'rb') as f:
+        pos = start
+        if start > 0:
+            f.seek(start - 1)
+            pos += len(f.readline()) - 1
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line.decode('ascii')
 
-        # compute target k in 1..100
-        target_k = (-sgn * pos) % 100
+def summarise_chunk(args):
+    filename, start, end = args
+    return summarise_rotations(read_chunk_lines(filename, start, end))
+
+def parallel_counts(filename, start=50, processes=None):
+    """
+    Split the file into byte ranges, summarise each in a worker process and
+    combine the summaries in order into the exact (part 1, part 2) totals.
+    """
+    processes = processes or os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    bounds = [size * i // processes for i in range(processes + 1)]
+    chunks = [(filename, a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+    with Pool(processes) as pool:
+        summaries = pool.map(summarise_chunk, chunks)
+
+    pos = start % 100
+    p1 = p2 = 0
+    for net, chunk_p1, chunk_p2 in summaries:
+        p1 += chunk_p1[pos]
+        p2 += chunk_p2[pos]
+        pos = (pos + net) % 100
+    return p1, p2
+
+def iter_deltas_mmap(filename):
+    """
+    Memory-map the file and yield one signed delta per rotation, parsed
+    straight from the bytes, so memory stays constant however long it is.
+    """
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                line = line.strip()
+                if not line:
+                    continue
+                dir_ = line[:1].upper()
+                dist = int(line[1:])
+                if dir_ == b'L':
+                    yield -dist
+                elif dir_ == b'R':
+                    yield dist
+                else:
+                    raise ValueError(f"Bad instruction: {line.decode(errors='replace')}")
+
+def stream_counts(deltas, start=50):
+    """Compute part 1 and part 2 together in a single pass over the deltas."""
+    pos = start
+    p1 = p2 = 0
+    for delta in deltas:
+        dist = abs(delta)
+        target_k = (-pos if delta > 0 else pos) % 100
         if target_k == 0:
             target_k = 100
-
         if target_k <= dist:
-            total += 1 + (dist - target_k) // 100
-
-        # update pos to end position
-        if dir_ == 'L':
-            pos = (pos - dist) % 100
-        else:
-            pos = (pos + dist) % 100
+            p2 += 1 + (dist - target_k) // 100
+        pos = (pos + delta) % 100
+        if pos == 0:
+            p1 += 1
+    return p1, p2
 
-    return total
+def read_file_bytes(filename):
+    with open(filename, 'rb') as f:
+        return f.read()
 
 def read_file_lines(filename):
     with open(filename, 'r', encoding='utf-8') as f:
@@ -158,12 +286,25 @@ def read_file_lines(filename):
 
 def main(argv):
     if len(argv) < 2:
-        print("Usage: python solve.py input.txt")
+        print("Usage: python solve.py input.txt [--numpy | --parallel[=N] | --stream]")
         return
     filename = argv[1]
-    rotations = read_file_lines(filename)
-    p1 = part1_count(rotations)
-    p2 = part2_count(rotations)
+    parallel = [arg for arg in argv[2:] if arg.startswith("--parallel")]
+    if "--stream" in argv[2:]:
+        p1, p2 = stream_counts(iter_deltas_mmap(filename))
+    elif parallel:
+        _, _, jobs = parallel[0].partition("=")
+        p1, p2 = parallel_counts(filename, processes=int(jobs) if jobs else None)
+    elif "--numpy" in argv[2:]:
+        if np is None:
+            raise SystemExit("--numpy requires numpy to be installed")
+        deltas = parse_deltas(read_file_bytes(filename))
+        p1 = part1_count_numpy(deltas)
+        p2 = part2_count_numpy(deltas)
+    else:
+        rotations = read_file_lines(filename)
+        p1 = part1_count(rotations)
+        p2 = part2_count(rotations)
     print("Part 1 (count at end of rotations):", p1)
     print("Part 2 (count during rotations):   ", p2)
 
@@ -1,3 +1,7 @@
+import sys
+from bisect import bisect_right
+
+
 def parse_ranges(ranges_str):
     ranges = []
     for part in ranges_str.split(","):
@@ -26,59 +30,66 @@ def generate_double_numbers(max_value):
     return doubles
 
 
-def sum_invalid_ids_from_file(filename):
-    # read file
-    with open(filename, "r") as f:
-        ranges_str = f.read().strip()
+def merge_ranges(ranges):
+    # sort by start and join overlapping ranges so no ID is summed twice
+    merged = []
+    for a, b in sorted(ranges):
+        if merged and a <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    return merged
 
-    ranges = parse_ranges(ranges_str)
-    max_end = max(b for _, b in ranges)
 
-    # all double numbers up to max_end
-    doubles = generate_double_numbers(max_end)
+def build_range_index(ranges):
+    # merged, sorted starts and ends; lookups bisect into starts
+    merged = merge_ranges(ranges)
+    return [a for a, _ in merged], [b for _, b in merged]
 
-    # collect all invalid numbers that fall in ANY range
-    found = set()
 
-    for n in doubles:
-        for a, b in ranges:
-            if a <= n <= b:
-                found.add(n)
-                break
+def in_range_index(n, index):
+    starts, ends = index
+    i = bisect_right(starts, n) - 1
+    return i >= 0 and n <= ends[i]
 
-    return sum(found)
 
+def digit_length_windows(index):
+    # (digit length, lowest, highest) for each merged range, split wherever
+    # the range crosses into more digits
+    for a, b in zip(*index):
+        for length in range(len(str(a)), len(str(b)) + 1):
+            yield length, max(a, 10 ** (length - 1)), min(b, 10 ** length - 1)
 
-if __name__ == "__main__":
-    result = sum_invalid_ids_from_file("input.txt")
-    print(result)
 
-def parse_ranges(ranges_str):
-    ranges = []
-    for part in ranges_str.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        a, b = part.split("-")
-        ranges.append((int(a), int(b)))
-    return ranges
+def sum_double_numbers_in_range(a, b):
+    # S+S with len(S) == l is S * (10**l + 1), so the doubles inside [a, b]
+    # are an arithmetic series over an interval of S
+    total = 0
+    for l in range(1, len(str(b)) // 2 + 1):
+        m = 10 ** l + 1
+        lo = max(10 ** (l - 1), -(-a // m))
+        hi = min(10 ** l - 1, b // m)
+        if lo <= hi:
+            total += m * (lo + hi) * (hi - lo + 1) // 2
+    return total
 
 
-def generate_double_numbers(max_value):
-    # "double numbers" are numbers formed as S+S (e.g., "12"+"12" = 1212)
-    max_digits = len(str(max_value))
-    doubles = []
+def sum_invalid_ids_closed_form(ranges):
+    return sum(sum_double_numbers_in_range(a, b) for a, b in merge_ranges(ranges))
 
-    # total length = 2*l, so S has length l
-    for l in range(1, max_digits // 2 + 1):
-        start = 10 ** (l - 1)
-        end = 10 ** l - 1
-        for s in range(start, end + 1):
-            n = int(str(s) + str(s))
-            if n > max_value:
-                break
-            doubles.append(n)
-    return doubles
+
+def iter_invalid_ids(ranges):
+    # Yield every double number inside the ranges lazily and in ascending
+    # order; within one digit length they are the progression S * (10**l + 1),
+    # so nothing is collected up front.
+    for a, b in merge_ranges(ranges):
+        for length in range(len(str(a)), len(str(b)) + 1):
+            if length % 2:
+                continue
+            m = 10 ** (length // 2) + 1
+            lo = max(a, 10 ** (length - 1))
+            hi = min(b, 10 ** length - 1)
+            yield from range(-(-lo // m) * m, hi // m * m + 1, m)
 
 
 def sum_invalid_ids_from_file(filename):
@@ -87,23 +98,31 @@ def sum_invalid_ids_from_file(filename):
         ranges_str = f.read().strip()
 
     ranges = parse_ranges(ranges_str)
-    max_end = max(b for _, b in ranges)
+    index = build_range_index(ranges)
 
-    # all double numbers up to max_end
-    doubles = generate_double_numbers(max_end)
+    # only double numbers inside each merged range's own digit-length
+    # windows, so the gaps between ranges are never scanned
+    total = 0
+    for length, lo, hi in digit_length_windows(index):
+        if length % 2:
+            continue
+        m = 10 ** (length // 2) + 1
+        for s in range(-(-lo // m), hi // m + 1):
+            total += s * m
 
-    # collect all invalid numbers that fall in ANY range
-    found = set()
+    return total
 
-    for n in doubles:
-        for a, b in ranges:
-            if a <= n <= b:
-                found.add(n)
-                break
 
-    return sum(found)
+def sum_invalid_ids_closed_form_from_file(filename):
+    with open(filename, "r") as f:
+        ranges_str = f.read().strip()
+    return sum_invalid_ids_closed_form(parse_ranges(ranges_str))
 
 
 if __name__ == "__main__":
-    result = sum_invalid_ids_from_file("input.txt")
+    if "--index" in sys.argv[1:]:
+        result = sum_invalid_ids_from_file("input.txt")
+    else:
+        result = sum_invalid_ids_closed_form_from_file("input.txt")
     print(result)
+
@@ -1,3 +1,7 @@
+import sys
+from bisect import bisect_right
+from heapq import merge
+
 def parse_ranges(ranges_str):
     rngs = []
     for part in ranges_str.split(","):
@@ -27,69 +31,131 @@ def generate_repeated_numbers(max_value):
                 found.add(n)
     return found
 
-def sum_invalid_ids_part2_from_file(filename):
-    with open(filename, "r") as f:
-        ranges_str = f.read().strip()
-    ranges = parse_ranges(ranges_str)
-    max_end = max(b for _, b in ranges)
-    repeated = generate_repeated_numbers(max_end)
-    found = set()
-    for n in repeated:
-        for a, b in ranges:
-            if a <= n <= b:
-                found.add(n)
-                break
-    return sum(found), len(found)
+def merge_ranges(ranges):
+    # sort by start and join overlapping ranges so no ID is summed twice
+    merged = []
+    for a, b in sorted(ranges):
+        if merged and a <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    return merged
 
-if __name__ == "__main__":
-    total, count = sum_invalid_ids_part2_from_file("input.txt")
-    print(total)
-    # print("count:", count)
+def build_range_index(ranges):
+    # merged, sorted starts and ends; lookups bisect into starts
+    merged = merge_ranges(ranges)
+    return [a for a, _ in merged], [b for _, b in merged]
 
-def parse_ranges(ranges_str):
-    rngs = []
-    for part in ranges_str.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        a, b = part.split("-")
-        rngs.append((int(a), int(b)))
-    return rngs
+def in_range_index(n, index):
+    starts, ends = index
+    i = bisect_right(starts, n) - 1
+    return i >= 0 and n <= ends[i]
 
-def generate_repeated_numbers(max_value):
-    max_digits = len(str(max_value))
-    found = set()
-    # base length l from 1..max_digits-1 (must repeat at least twice)
-    for l in range(1, max_digits):
-        start = 10**(l-1)
-        end = 10**l - 1
-        max_k = max_digits // l
-        if max_k < 2:
-            continue
-        for s in range(start, end+1):
-            base = str(s)
-            for k in range(2, max_k+1):
-                n = int(base * k)
-                if n > max_value:
-                    break
-                found.add(n)
-    return found
+def digit_length_windows(index):
+    # (digit length, lowest, highest) for each merged range, split wherever
+    # the range crosses into more digits
+    for a, b in zip(*index):
+        for length in range(len(str(a)), len(str(b)) + 1):
+            yield length, max(a, 10**(length-1)), min(b, 10**length - 1)
+
+def mobius(n):
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+def sum_period_numbers(lo, hi, total_len, l):
+    # L-digit numbers made of an l-digit base s repeated L/l times are
+    # s * (10**L - 1) / (10**l - 1); returns (sum, count) of those in [lo, hi]
+    m = (10**total_len - 1) // (10**l - 1)
+    s_lo = max(10**(l-1), -(-lo // m))
+    s_hi = min(10**l - 1, hi // m)
+    if s_lo > s_hi:
+        return 0, 0
+    return m * (s_lo + s_hi) * (s_hi - s_lo + 1) // 2, s_hi - s_lo + 1
+
+def sum_repeated_numbers_in_range(a, b):
+    # Per length L, with S(l) the numbers that repeat with period l, the ones
+    # repeating with some period l < L are -sum(mobius(L/l) * S(l)) over
+    # divisors l of L (Möbius inversion), so 111111 is counted exactly once
+    total = count = 0
+    for total_len in range(max(2, len(str(a))), len(str(b)) + 1):
+        lo = max(a, 10**(total_len-1))
+        hi = min(b, 10**total_len - 1)
+        for l in range(1, total_len // 2 + 1):
+            if total_len % l:
+                continue
+            mu = mobius(total_len // l)
+            if mu:
+                s, c = sum_period_numbers(lo, hi, total_len, l)
+                total -= mu * s
+                count -= mu * c
+    return total, count
+
+def sum_invalid_ids_closed_form(ranges):
+    total = count = 0
+    for a, b in merge_ranges(ranges):
+        s, c = sum_repeated_numbers_in_range(a, b)
+        total += s
+        count += c
+    return total, count
+
+def iter_invalid_ids(ranges):
+    # Yield every invalid ID inside the ranges lazily, in ascending order and
+    # once each. Per digit length the candidates of each period l are the
+    # arithmetic progression s * m, so they are merged as range objects and
+    # memory stays constant no matter how large the ranges are.
+    for a, b in merge_ranges(ranges):
+        for total_len in range(max(2, len(str(a))), len(str(b)) + 1):
+            lo = max(a, 10**(total_len-1))
+            hi = min(b, 10**total_len - 1)
+            streams = []
+            for l in range(1, total_len // 2 + 1):
+                if total_len % l:
+                    continue
+                m = (10**total_len - 1) // (10**l - 1)
+                s_lo = max(10**(l-1), -(-lo // m))
+                streams.append(range(s_lo * m, hi // m * m + 1, m))
+            last = None
+            for n in merge(*streams):
+                if n != last:
+                    yield n
+                    last = n
 
 def sum_invalid_ids_part2_from_file(filename):
     with open(filename, "r") as f:
         ranges_str = f.read().strip()
     ranges = parse_ranges(ranges_str)
-    max_end = max(b for _, b in ranges)
-    repeated = generate_repeated_numbers(max_end)
+    index = build_range_index(ranges)
+    # only repeated numbers inside each merged range's own digit-length
+    # windows, so the gaps between ranges are never scanned; the set drops
+    # numbers with more than one period, like 111111
     found = set()
-    for n in repeated:
-        for a, b in ranges:
-            if a <= n <= b:
-                found.add(n)
-                break
+    for total_len, lo, hi in digit_length_windows(index):
+        for l in range(1, total_len // 2 + 1):
+            if total_len % l:
+                continue
+            m = (10**total_len - 1) // (10**l - 1)
+            for s in range(max(10**(l-1), -(-lo // m)), hi // m + 1):
+                found.add(s * m)
     return sum(found), len(found)
 
+def sum_invalid_ids_closed_form_from_file(filename):
+    with open(filename, "r") as f:
+        ranges_str = f.read().strip()
+    return sum_invalid_ids_closed_form(parse_ranges(ranges_str))
+
 if __name__ == "__main__":
-    total, count = sum_invalid_ids_part2_from_file("input.txt")
+    if "--index" in sys.argv[1:]:
+        total, count = sum_invalid_ids_part2_from_file("input.txt")
+    else:
+        total, count = sum_invalid_ids_closed_form_from_file("input.txt")
     print(total)
     # print("count:", count)
+
@@ -1,52 +1,84 @@
-def find_max_two_digit_number(digits_str):
-    """Return the largest two-digit number formed by two digits in order."""
-    digits = [int(ch) for ch in digits_str]
-    max_val = -1
-    n = len(digits)
-    
-    for i in range(n - 1):
-        first = digits[i]
-        # Find the largest digit after i
-        max_after = max(digits[i + 1:])
-        value = 10 * first + max_after
-        if value > max_val:
-            max_val = value
-    
-    return max_val
+import sys
 
-def main():
-    total = 0
-    
-    # Read from input.txt
-    with open('input.txt', 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            max_val = find_max_two_digit_number(line)
-            total += max_val
-    
-    print(total)
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
+
+def max_subsequence_number(digits_str, m):
+    """
+    Return the largest m-digit number formed by m digits in order.
+
+    Greedy monotonic stack: while a smaller digit sits on top and we can
+    still afford to drop digits, a bigger one should replace it. Each digit
+    is pushed and popped at most once, so this is O(n) for any m.
+    """
+    n = len(digits_str)
+    if n < m:
+        return 0
+    drop = n - m
+    stack = []
+    for ch in digits_str:
+        while drop and stack and stack[-1] < ch:
+            stack.pop()
+            drop -= 1
+        stack.append(ch)
+    return int("".join(stack[:m])) if m else 0
 
-if __name__ == "__main__":
-    main()
 def find_max_two_digit_number(digits_str):
     """Return the largest two-digit number formed by two digits in order."""
-    digits = [int(ch) for ch in digits_str]
-    max_val = -1
-    n = len(digits)
-    
-    for i in range(n - 1):
-        first = digits[i]
-        # Find the largest digit after i
-        max_after = max(digits[i + 1:])
-        value = 10 * first + max_after
-        if value > max_val:
-            max_val = value
-    
-    return max_val
+    return max_subsequence_number(digits_str, 2)
+
+def batch_max_numbers(data, m):
+    """
+    Batch mode for files whose lines all have the same length.
+
+    Loads the bytes as a 2-D uint8 array and runs the greedy selection for
+    every row at once: pick p is the leftmost argmax over the window between
+    the previous pick and the last position that still leaves room for the
+    rest. Returns (per-line values, total).
+    """
+    if m > 18:
+        raise ValueError("batch mode keeps values in int64, so m must be <= 18")
+    data = data.replace(b"\r\n", b"\n").strip()
+    width = data.find(b"\n")
+    if width == -1:
+        width = len(data)
+    buf = np.frombuffer(data + b"\n", dtype=np.uint8)
+    if width == 0 or buf.size % (width + 1):
+        raise ValueError("batch mode needs lines that all have the same length")
+    grid = buf.reshape(-1, width + 1)
+    if (grid[:, width] != ord("\n")).any():
+        raise ValueError("batch mode needs lines that all have the same length")
+    grid = grid[:, :width].astype(np.int8) - ord("0")
+    if ((grid < 0) | (grid > 9)).any():
+        raise ValueError("batch mode expects lines of digits only")
+
+    rows = np.arange(grid.shape[0])
+    values = np.zeros(grid.shape[0], dtype=np.int64)
+    if width < m:
+        return values, 0
+    start = np.zeros(grid.shape[0], dtype=np.int64)
+    for pick in range(m):
+        end = width - (m - pick - 1)
+        lo = int(start.min())
+        cols = np.arange(lo, end)
+        window = np.where(cols >= start[:, None], grid[:, lo:end], -1)
+        pos = lo + window.argmax(axis=1)
+        values = values * 10 + grid[rows, pos]
+        start = pos + 1
+    # sum as Python ints: millions of values near 10**m overflow int64
+    return values, sum(values.tolist())
 
 def main():
+    if "--numpy" in sys.argv[1:]:
+        if np is None:
+            raise SystemExit("--numpy requires numpy to be installed")
+        with open('input.txt', 'rb') as f:
+            _, total = batch_max_numbers(f.read(), 2)
+        print(total)
+        return
+
     total = 0
     
     # Read from input.txt
@@ -61,4 +93,4 @@ def main():
     print(total)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
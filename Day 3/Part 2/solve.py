@@ -1,80 +1,146 @@
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
+
+def max_subsequence_number(digits_str, m):
+    """
+    Return the largest m-digit number formed by m digits in order.
+
+    Greedy monotonic stack: while a smaller digit sits on top and we can
+    still afford to drop digits, a bigger one should replace it. Each digit
+    is pushed and popped at most once, so this is O(n) for any m.
+    """
+    n = len(digits_str)
+    if n < m:
+        return 0
+    drop = n - m
+    stack = []
+    for ch in digits_str:
+        while drop and stack and stack[-1] < ch:
+            stack.pop()
+            drop -= 1
+        stack.append(ch)
+    return int("".join(stack[:m])) if m else 0
+
 def find_max_m_digit_number(digits_str, m=12):
     """Return the largest m-digit number formed by m digits in order."""
-    digits = [int(ch) for ch in digits_str]
+    return max_subsequence_number(digits_str, m)
+
+def build_sparse_table(digits):
+    """table[k][i] is the leftmost position of the max of digits[i:i + 2**k]."""
     n = len(digits)
-    if n < m:
-        return 0  # Not enough digits, but problem likely gives enough
-    
-    result_digits = []
-    start = 0
-    
-    for pick in range(m):
-        # We need to leave (m - pick - 1) digits after chosen one
-        end = n - (m - pick - 1)
-        # Find max in range [start, end)
-        max_digit = -1
-        max_pos = start
-        for pos in range(start, end):
-            if digits[pos] > max_digit:
-                max_digit = digits[pos]
-                max_pos = pos
-        result_digits.append(max_digit)
-        start = max_pos + 1
-    
-    # Convert list of digits to integer
-    total = 0
-    for d in result_digits:
-        total = total * 10 + d
-    return total
+    table = [list(range(n))]
+    k = 1
+    while (1 << k) <= n:
+        prev = table[-1]
+        half = 1 << (k - 1)
+        row = []
+        for i in range(n - (1 << k) + 1):
+            a, b = prev[i], prev[i + half]
+            row.append(a if digits[a] >= digits[b] else b)
+        table.append(row)
+        k += 1
+    return table
 
-def main():
-    total = 0
-    m = 12
-    
-    with open('input.txt', 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            max_val = find_max_m_digit_number(line, m)
-            total += max_val
-    
-    print(total)
+def range_max_pos(table, digits, lo, hi):
+    """Leftmost position of the max of digits[lo..hi] (inclusive) in O(1)."""
+    k = (hi - lo + 1).bit_length() - 1
+    a, b = table[k][lo], table[k][hi - (1 << k) + 1]
+    return a if digits[a] >= digits[b] else b
 
-if __name__ == "__main__":
-    main()
-def find_max_m_digit_number(digits_str, m=12):
-    """Return the largest m-digit number formed by m digits in order."""
+def find_max_numbers(digits_str, ms):
+    """
+    Return the largest number for every m in ms, in the same order.
+    The sparse table is built once per line in O(n log n); each m is then
+    answered with m range-max queries.
+    """
     digits = [int(ch) for ch in digits_str]
     n = len(digits)
-    if n < m:
-        return 0  # Not enough digits, but problem likely gives enough
-    
-    result_digits = []
-    start = 0
-    
+    table = build_sparse_table(digits)
+    results = []
+    for m in ms:
+        if n < m:
+            results.append(0)
+            continue
+        value = 0
+        start = 0
+        for pick in range(m):
+            pos = range_max_pos(table, digits, start, n - (m - pick))
+            value = value * 10 + digits[pos]
+            start = pos + 1
+        results.append(value)
+    return results
+
+def batch_max_numbers(data, m):
+    """
+    Batch mode for files whose lines all have the same length.
+
+    Loads the bytes as a 2-D uint8 array and runs the greedy selection for
+    every row at once: pick p is the leftmost argmax over the window between
+    the previous pick and the last position that still leaves room for the
+    rest. Returns (per-line values, total).
+    """
+    if m > 18:
+        raise ValueError("batch mode keeps values in int64, so m must be <= 18")
+    data = data.replace(b"\r\n", b"\n").strip()
+    width = data.find(b"\n")
+    if width == -1:
+        width = len(data)
+    buf = np.frombuffer(data + b"\n", dtype=np.uint8)
+    if width == 0 or buf.size % (width + 1):
+        raise ValueError("batch mode needs lines that all have the same length")
+    grid = buf.reshape(-1, width + 1)
+    if (grid[:, width] != ord("\n")).any():
+        raise ValueError("batch mode needs lines that all have the same length")
+    grid = grid[:, :width].astype(np.int8) - ord("0")
+    if ((grid < 0) | (grid > 9)).any():
+        raise ValueError("batch mode expects lines of digits only")
+
+    rows = np.arange(grid.shape[0])
+    values = np.zeros(grid.shape[0], dtype=np.int64)
+    if width < m:
+        return values, 0
+    start = np.zeros(grid.shape[0], dtype=np.int64)
     for pick in range(m):
-        # We need to leave (m - pick - 1) digits after chosen one
-        end = n - (m - pick - 1)
-        # Find max in range [start, end)
-        max_digit = -1
-        max_pos = start
-        for pos in range(start, end):
-            if digits[pos] > max_digit:
-                max_digit = digits[pos]
-                max_pos = pos
-        result_digits.append(max_digit)
-        start = max_pos + 1
-    
-    # Convert list of digits to integer
-    total = 0
-    for d in result_digits:
-        total = total * 10 + d
-    return total
+        end = width - (m - pick - 1)
+        lo = int(start.min())
+        cols = np.arange(lo, end)
+        window = np.where(cols >= start[:, None], grid[:, lo:end], -1)
+        pos = lo + window.argmax(axis=1)
+        values = values * 10 + grid[rows, pos]
+        start = pos + 1
+    # sum as Python ints: millions of values near 10**m overflow int64
+    return values, sum(values.tolist())
 
 def main():
     total = 0
     m = 12
+
+    multi = [arg for arg in sys.argv[1:] if arg.startswith("--m=")]
+    if multi:
+        ms = [int(x) for x in multi[0][len("--m="):].split(",")]
+        totals = [0] * len(ms)
+        with open('input.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                for i, value in enumerate(find_max_numbers(line, ms)):
+                    totals[i] += value
+        for m, total in zip(ms, totals):
+            print(f"{m}: {total}")
+        return
+
+    if "--numpy" in sys.argv[1:]:
+        if np is None:
+            raise SystemExit("--numpy requires numpy to be installed")
+        with open('input.txt', 'rb') as f:
+            _, total = batch_max_numbers(f.read(), m)
+        print(total)
+        return
     
     with open('input.txt', 'r') as f:
         for line in f:
@@ -87,4 +153,4 @@ def main():
     print(total)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,36 +1,132 @@
+import mmap
+import struct
+import sys
 from pathlib import Path
 
-p = Path('input.txt')
-data = p.read_text().strip().splitlines()
-grid = [list(line.rstrip()) for line in data if line.strip()!='']
-h = len(grid)
-w = max(len(row) for row in grid) if h>0 else 0
-for row in grid:
-    row += ['.']*(w-len(row))
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
 
 dirs = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
-accessible = []
-for i in range(h):
-    for j in range(w):
-        if grid[i][j]=='@':
-            cnt = 0
-            for di,dj in dirs:
-                ni,nj = i+di, j+dj
-                if 0<=ni<h and 0<=nj<w and grid[ni][nj]=='@':
-                    cnt += 1
-            if cnt < 4:
-                accessible.append((i,j))
 
-print("Accessible count:", len(accessible))
-# optional: print marked grid
-out = [row.copy() for row in grid]
-for i,j in accessible:
-    out[i][j] = 'x'
-print("\n".join("".join(row) for row in out))
+def neighbour_counts(rolls):
+    """All eight-neighbour counts at once as a sum of shifted arrays."""
+    h, w = rolls.shape
+    padded = np.pad(rolls, 1).astype(np.uint8)
+    counts = np.zeros((h, w), dtype=np.uint8)
+    for di,dj in dirs:
+        counts += padded[1+di:1+di+h, 1+dj:1+dj+w]
+    return counts
 
-from pathlib import Path
+def pack_rows(grid):
+    """Pack each row into an int with bit j set when column j holds a roll."""
+    return [int("".join('1' if c == '@' else '0' for c in reversed(row)) or '0', 2)
+            for row in grid]
+
+def accessible_rows(rows, w):
+    """
+    Bit-parallel accessibility for packed rows: the eight shifted neighbour
+    rows are added into a 2-bit saturating counter per column, and a roll is
+    accessible unless that counter overflowed (4 or more neighbours).
+    """
+    full = (1 << w) - 1
+    out = []
+    for i, row in enumerate(rows):
+        up = rows[i-1] if i > 0 else 0
+        down = rows[i+1] if i+1 < len(rows) else 0
+        c0 = c1 = ge4 = 0
+        for x in (up << 1, up, up >> 1, row << 1, row >> 1, down << 1, down, down >> 1):
+            x &= full
+            carry = c0 & x
+            c0 ^= x
+            ge4 |= c1 & carry
+            c1 ^= carry
+        out.append(row & ~ge4)
+    return out
+
+def bit_positions(x):
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+TO_BITS = bytes(ord('1') if b == ord('@') else ord('0') for b in range(256))
+
+def grid_layout(mm):
+    """(rows, width, stride) of a mapped grid whose lines all have the same length."""
+    size = len(mm)
+    while size and mm[size-1] in b" \t\r\n":
+        size -= 1
+    nl = mm.find(b"\n", 0, size)
+    if nl == -1:
+        return (1, size, size+1) if size else (0, 0, 1)
+    w = nl-1 if nl and mm[nl-1] == ord('\r') else nl
+    stride = nl + 1
+    if (size + stride - w) % stride:
+        raise ValueError("tiled mode needs lines that all have the same length")
+    return (size + stride - w) // stride, w, stride
+
+def read_packed_rows(mm, lo, hi, w, stride):
+    """Rows lo..hi-1 of the mapped grid, packed like pack_rows."""
+    rows = []
+    for i in range(lo, hi):
+        off = i * stride
+        if mm[off+w:off+w+1] not in (b"", b"\n", b"\r"):
+            raise ValueError(f"tiled mode needs lines that all have the same length (row {i})")
+        rows.append(int(mm[off:off+w].translate(TO_BITS)[::-1], 2) if w else 0)
+    return rows
+
+def tiled_accessible_count(path, band_rows=1024):
+    """
+    Count accessible rolls straight from a memory-mapped grid file, one band
+    of rows at a time. Each band is packed together with one halo row above
+    and below, so only band_rows + 2 rows are held in memory at once.
+    """
+    with open(path, 'rb') as f:
+        if not f.seek(0, 2):
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h, w, stride = grid_layout(mm)
+            total = 0
+            for r0 in range(0, h, band_rows):
+                r1 = min(h, r0 + band_rows)
+                lo, hi = max(0, r0-1), min(h, r1+1)
+                acc = accessible_rows(read_packed_rows(mm, lo, hi, w, stride), w)
+                total += sum(bin(row).count('1') for row in acc[r0-lo:r1-lo])
+    return total
+
+def write_result(path, magic, h, w, counts, cells):
+    """
+    Write a compact binary result: magic, h, w and the number of counts as
+    a little-endian header, the counts as uint64, then a bitmap of cells with
+    one row of ceil(w/8) bytes per grid row, bit j (LSB first) = column j.
+    """
+    rows = [0] * h
+    for i,j in cells:
+        rows[i] |= 1 << j
+    row_bytes = (w + 7) // 8
+    with open(path, 'wb') as f:
+        f.write(struct.pack(f'<4sIII{len(counts)}Q', magic, h, w, len(counts), *counts))
+        f.write(b"".join(row.to_bytes(row_bytes, 'little') for row in rows))
+
+PGM_SHADES = bytes.maketrans(b'@x.', b'\x00\x80\xff')
+
+def write_pgm(path, grid):
+    """Render the grid as a binary PGM in one write: rolls black, 'x' grey, empty white."""
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    pixels = "".join("".join(row) for row in grid).encode().translate(PGM_SHADES)
+    with open(path, 'wb') as f:
+        f.write(b"P5\n%d %d\n255\n" % (w, h) + pixels)
 
 p = Path('input.txt')
+tiled = [arg for arg in sys.argv[1:] if arg.startswith("--tiled")]
+if tiled:
+    _, _, band_rows = tiled[0].partition("=")
+    print("Accessible count:", tiled_accessible_count(p, int(band_rows or 1024)))
+    sys.exit()
+
 data = p.read_text().strip().splitlines()
 grid = [list(line.rstrip()) for line in data if line.strip()!='']
 h = len(grid)
@@ -38,22 +134,39 @@ w = max(len(row) for row in grid) if h>0 else 0
 for row in grid:
     row += ['.']*(w-len(row))
 
-dirs = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
-accessible = []
-for i in range(h):
-    for j in range(w):
-        if grid[i][j]=='@':
-            cnt = 0
-            for di,dj in dirs:
-                ni,nj = i+di, j+dj
-                if 0<=ni<h and 0<=nj<w and grid[ni][nj]=='@':
-                    cnt += 1
-            if cnt < 4:
-                accessible.append((i,j))
+if "--numpy" in sys.argv[1:]:
+    if np is None:
+        raise SystemExit("--numpy requires numpy to be installed")
+    rolls = np.array(grid, dtype='U1').reshape(h, w) == '@'
+    mask = rolls & (neighbour_counts(rolls) < 4)
+    accessible = [tuple(cell) for cell in np.argwhere(mask).tolist()]
+elif "--bits" in sys.argv[1:]:
+    accessible = [(i,j) for i, row in enumerate(accessible_rows(pack_rows(grid), w))
+                  for j in bit_positions(row)]
+else:
+    accessible = []
+    for i in range(h):
+        for j in range(w):
+            if grid[i][j]=='@':
+                cnt = 0
+                for di,dj in dirs:
+                    ni,nj = i+di, j+dj
+                    if 0<=ni<h and 0<=nj<w and grid[ni][nj]=='@':
+                        cnt += 1
+                if cnt < 4:
+                    accessible.append((i,j))
 
 print("Accessible count:", len(accessible))
-# optional: print marked grid
-out = [row.copy() for row in grid]
-for i,j in accessible:
-    out[i][j] = 'x'
-print("\n".join("".join(row) for row in out))
+write_result('accessible.bin', b'D4P1', h, w, [len(accessible)], accessible)
+
+# optional: print or render the marked grid; only built when asked for
+print_grid = "--print-grid" in sys.argv[1:]
+pgm = "--pgm" in sys.argv[1:]
+if print_grid or pgm:
+    out = [row.copy() for row in grid]
+    for i,j in accessible:
+        out[i][j] = 'x'
+    if print_grid:
+        print("\n".join("".join(row) for row in out))
+    if pgm:
+        write_pgm('accessible.pgm', out)
@@ -1,45 +1,233 @@
+import mmap
+import shutil
+import struct
+import sys
+from collections import deque
 from pathlib import Path
 
-p = Path('input.txt')
-data = p.read_text().strip().splitlines()
-grid = [list(line.rstrip()) for line in data if line.strip()!='']
-h = len(grid)
-w = max(len(row) for row in grid) if h>0 else 0
-for row in grid:
-    row += ['.']*(w-len(row))
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
 
 dirs = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
 
-total_removed = 0
-round_num = 0
-while True:
-    to_remove = []
+def peel_rounds(grid):
+    """
+    Worklist peeling: neighbour counts are computed once and decremented as
+    rolls are removed, and a roll is queued for the next round only when its
+    count drops from 4 to 3. Removes the rolls from grid in place and returns
+    the list of cells removed in each round, O(area) overall.
+    """
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    counts = [[0]*w for _ in range(h)]
     for i in range(h):
         for j in range(w):
             if grid[i][j] == '@':
-                cnt = 0
                 for di,dj in dirs:
                     ni, nj = i+di, j+dj
                     if 0 <= ni < h and 0 <= nj < w and grid[ni][nj] == '@':
-                        cnt += 1
-                if cnt < 4:
-                    to_remove.append((i,j))
-    if not to_remove:
-        break
-    round_num += 1
-    print(f"Round {round_num}: removing {len(to_remove)} rolls")
-    total_removed += len(to_remove)
-    for i,j in to_remove:
-        grid[i][j] = '.'   # remove
+                        counts[i][j] += 1
 
-print("Total removed:", total_removed)
-# optionally print final grid
-print("\nFinal grid:")
-print("\n".join("".join(row) for row in grid))
+    queue = deque((i,j) for i in range(h) for j in range(w)
+                  if grid[i][j] == '@' and counts[i][j] < 4)
+    rounds = []
+    while queue:
+        removed = list(queue)
+        queue.clear()
+        for i,j in removed:
+            grid[i][j] = '.'   # remove
+        for i,j in removed:
+            for di,dj in dirs:
+                ni, nj = i+di, j+dj
+                if 0 <= ni < h and 0 <= nj < w and grid[ni][nj] == '@':
+                    counts[ni][nj] -= 1
+                    if counts[ni][nj] == 3:
+                        queue.append((ni,nj))
+        rounds.append(removed)
+    return rounds
 
-from pathlib import Path
+def neighbour_counts(rolls):
+    """All eight-neighbour counts at once as a sum of shifted arrays."""
+    h, w = rolls.shape
+    padded = np.pad(rolls, 1).astype(np.uint8)
+    counts = np.zeros((h, w), dtype=np.uint8)
+    for di,dj in dirs:
+        counts += padded[1+di:1+di+h, 1+dj:1+dj+w]
+    return counts
+
+def peel_rounds_numpy(grid):
+    """Same rounds as peel_rounds, each one a vectorized neighbour count."""
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    rolls = np.array(grid, dtype='U1').reshape(h, w) == '@'
+    rounds = []
+    while True:
+        mask = rolls & (neighbour_counts(rolls) < 4)
+        removed = [tuple(cell) for cell in np.argwhere(mask).tolist()]
+        if not removed:
+            return rounds
+        rolls &= ~mask
+        for i,j in removed:
+            grid[i][j] = '.'   # remove
+        rounds.append(removed)
+
+def pack_rows(grid):
+    """Pack each row into an int with bit j set when column j holds a roll."""
+    return [int("".join('1' if c == '@' else '0' for c in reversed(row)) or '0', 2)
+            for row in grid]
+
+def accessible_rows(rows, w):
+    """
+    Bit-parallel accessibility for packed rows: the eight shifted neighbour
+    rows are added into a 2-bit saturating counter per column, and a roll is
+    accessible unless that counter overflowed (4 or more neighbours).
+    """
+    full = (1 << w) - 1
+    out = []
+    for i, row in enumerate(rows):
+        up = rows[i-1] if i > 0 else 0
+        down = rows[i+1] if i+1 < len(rows) else 0
+        c0 = c1 = ge4 = 0
+        for x in (up << 1, up, up >> 1, row << 1, row >> 1, down << 1, down, down >> 1):
+            x &= full
+            carry = c0 & x
+            c0 ^= x
+            ge4 |= c1 & carry
+            c1 ^= carry
+        out.append(row & ~ge4)
+    return out
+
+def bit_positions(x):
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+def peel_rounds_bits(grid):
+    """Same rounds as peel_rounds, on rows packed into Python ints."""
+    w = len(grid[0]) if grid else 0
+    rows = pack_rows(grid)
+    rounds = []
+    while True:
+        acc = accessible_rows(rows, w)
+        removed = [(i,j) for i, row in enumerate(acc) for j in bit_positions(row)]
+        if not removed:
+            return rounds
+        rows = [row & ~a for row, a in zip(rows, acc)]
+        for i,j in removed:
+            grid[i][j] = '.'   # remove
+        rounds.append(removed)
+
+TO_BITS = bytes(ord('1') if b == ord('@') else ord('0') for b in range(256))
+
+def grid_layout(mm):
+    """(rows, width, stride) of a mapped grid whose lines all have the same length."""
+    size = len(mm)
+    while size and mm[size-1] in b" \t\r\n":
+        size -= 1
+    nl = mm.find(b"\n", 0, size)
+    if nl == -1:
+        return (1, size, size+1) if size else (0, 0, 1)
+    w = nl-1 if nl and mm[nl-1] == ord('\r') else nl
+    stride = nl + 1
+    if (size + stride - w) % stride:
+        raise ValueError("tiled mode needs lines that all have the same length")
+    return (size + stride - w) // stride, w, stride
+
+def read_packed_rows(mm, lo, hi, w, stride):
+    """Rows lo..hi-1 of the mapped grid, packed like pack_rows."""
+    rows = []
+    for i in range(lo, hi):
+        off = i * stride
+        if mm[off+w:off+w+1] not in (b"", b"\n", b"\r"):
+            raise ValueError(f"tiled mode needs lines that all have the same length (row {i})")
+        rows.append(int(mm[off:off+w].translate(TO_BITS)[::-1], 2) if w else 0)
+    return rows
+
+def peel_tiled(path, out_path, band_rows=1024):
+    """
+    Peel a grid that does not fit in memory: copy it to out_path, map the
+    copy and peel it one band of rows at a time. A band is peeled to a local
+    fixed point with its halo rows read-only; when its first or last row
+    changes, the neighbouring band sees a stale halo and is queued again,
+    until no band changes. The final grid is left in out_path and the total
+    number of removed rolls is returned (rounds are not tracked here).
+    """
+    shutil.copyfile(path, out_path)
+    total = 0
+    with open(out_path, 'r+b') as f:
+        if not f.seek(0, 2):
+            return 0
+        with mmap.mmap(f.fileno(), 0) as mm:
+            h, w, stride = grid_layout(mm)
+            nbands = -(-h // band_rows)
+            queue = deque(range(nbands))
+            queued = [True] * nbands
+            while queue:
+                b = queue.popleft()
+                queued[b] = False
+                r0, r1 = b * band_rows, min(h, (b+1) * band_rows)
+                lo, hi = max(0, r0-1), min(h, r1+1)
+                rows = read_packed_rows(mm, lo, hi, w, stride)
+                before = rows[r0-lo:r1-lo]
+                while True:
+                    acc = accessible_rows(rows, w)
+                    changed = False
+                    for k in range(r0-lo, r1-lo):
+                        if acc[k]:
+                            rows[k] &= ~acc[k]
+                            changed = True
+                    if not changed:
+                        break
+                after = rows[r0-lo:r1-lo]
+                for k, (old, new) in enumerate(zip(before, after)):
+                    off = (r0+k) * stride
+                    for j in bit_positions(old & ~new):
+                        mm[off+j] = ord('.')   # remove
+                        total += 1
+                if b > 0 and before[0] != after[0] and not queued[b-1]:
+                    queue.append(b-1)
+                    queued[b-1] = True
+                if b+1 < nbands and before[-1] != after[-1] and not queued[b+1]:
+                    queue.append(b+1)
+                    queued[b+1] = True
+    return total
+
+def write_result(path, magic, h, w, counts, cells):
+    """
+    Write a compact binary result: magic, h, w and the number of counts as
+    a little-endian header, the counts as uint64, then a bitmap of cells with
+    one row of ceil(w/8) bytes per grid row, bit j (LSB first) = column j.
+    """
+    rows = [0] * h
+    for i,j in cells:
+        rows[i] |= 1 << j
+    row_bytes = (w + 7) // 8
+    with open(path, 'wb') as f:
+        f.write(struct.pack(f'<4sIII{len(counts)}Q', magic, h, w, len(counts), *counts))
+        f.write(b"".join(row.to_bytes(row_bytes, 'little') for row in rows))
+
+PGM_SHADES = bytes.maketrans(b'@x.', b'\x00\x80\xff')
+
+def write_pgm(path, grid):
+    """Render the grid as a binary PGM in one write: rolls black, 'x' grey, empty white."""
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    pixels = "".join("".join(row) for row in grid).encode().translate(PGM_SHADES)
+    with open(path, 'wb') as f:
+        f.write(b"P5\n%d %d\n255\n" % (w, h) + pixels)
 
 p = Path('input.txt')
+tiled = [arg for arg in sys.argv[1:] if arg.startswith("--tiled")]
+if tiled:
+    _, _, band_rows = tiled[0].partition("=")
+    out_path = p.with_name(p.stem + '.peeled.txt')
+    print("Total removed:", peel_tiled(p, out_path, int(band_rows or 1024)))
+    print("Final grid written to", out_path)
+    sys.exit()
+
 data = p.read_text().strip().splitlines()
 grid = [list(line.rstrip()) for line in data if line.strip()!='']
 h = len(grid)
@@ -47,31 +235,35 @@ w = max(len(row) for row in grid) if h>0 else 0
 for row in grid:
     row += ['.']*(w-len(row))
 
-dirs = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
+if "--numpy" in sys.argv[1:]:
+    if np is None:
+        raise SystemExit("--numpy requires numpy to be installed")
+    engine = peel_rounds_numpy
+elif "--bits" in sys.argv[1:]:
+    engine = peel_rounds_bits
+else:
+    engine = peel_rounds
 
+verbose = "--print-grid" in sys.argv[1:]
+rounds = engine(grid)
 total_removed = 0
-round_num = 0
-while True:
-    to_remove = []
-    for i in range(h):
-        for j in range(w):
-            if grid[i][j] == '@':
-                cnt = 0
-                for di,dj in dirs:
-                    ni, nj = i+di, j+dj
-                    if 0 <= ni < h and 0 <= nj < w and grid[ni][nj] == '@':
-                        cnt += 1
-                if cnt < 4:
-                    to_remove.append((i,j))
-    if not to_remove:
-        break
-    round_num += 1
-    print(f"Round {round_num}: removing {len(to_remove)} rolls")
-    total_removed += len(to_remove)
-    for i,j in to_remove:
-        grid[i][j] = '.'   # remove
+for round_num, removed in enumerate(rounds, 1):
+    if verbose:
+        print(f"Round {round_num}: removing {len(removed)} rolls")
+    total_removed += len(removed)
 
 print("Total removed:", total_removed)
+write_result('removed.bin', b'D4P2', h, w,
+             [total_removed] + [len(removed) for removed in rounds],
+             [cell for removed in rounds for cell in removed])
+
 # optionally print final grid
-print("\nFinal grid:")
-print("\n".join("".join(row) for row in grid))
+if verbose:
+    print("\nFinal grid:")
+    print("\n".join("".join(row) for row in grid))
+if "--pgm" in sys.argv[1:]:
+    marked = [row.copy() for row in grid]
+    for removed in rounds:
+        for i,j in removed:
+            marked[i][j] = 'x'
+    write_pgm('removed.pgm', marked)
@@ -1,42 +1,16 @@
-<<<<<<< HEAD
-def parse_range(line):
-    """Parse a 'start-end' string into a tuple of ints."""
-    start, end = line.split("-")
-    return int(start), int(end)
-
-def is_fresh(id_value, ranges):
-    """Check if id_value falls within ANY of the ranges."""
-    for low, high in ranges:
-        if low <= id_value <= high:
-            return True
-    return False
-
-def main():
-    ranges = []
-    ids = []
-
-    with open("input.txt", "r") as f:
-        lines = [line.strip() for line in f if line.strip() != ""]
-
-    # Find first line that is NOT a range -> that starts the IDs
-    idx = 0
-    while idx < len(lines) and "-" in lines[idx]:
-        ranges.append(parse_range(lines[idx]))
-        idx += 1
-
-    # Remaining lines are ingredient IDs
-    for i in range(idx, len(lines)):
-        ids.append(int(lines[i]))
-
-    # Count fresh IDs
-    fresh_count = sum(1 for value in ids if is_fresh(value, ranges))
-
-    print("Total fresh ingredient IDs:", fresh_count)
-
-
-if __name__ == "__main__":
-    main()
-=======
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # only needed for --numpy
+    np = None
+
 def parse_range(line):
     """Parse a 'start-end' string into a tuple of ints."""
     start, end = line.split("-")
@@ -49,9 +23,135 @@ def is_fresh(id_value, ranges):
             return True
     return False
 
+def merge_ranges(ranges):
+    # Sort by start value
+    ranges.sort(key=lambda x: x[0])
+    merged = []
+
+    for r in ranges:
+        if not merged or r[0] > merged[-1][1] + 1:
+            # No overlap
+            merged.append([r[0], r[1]])
+        else:
+            # Overlap → extend end if needed
+            merged[-1][1] = max(merged[-1][1], r[1])
+
+    return merged
+
+def build_index(ranges):
+    """Merge the ranges and split them into sorted (starts, ends) lists."""
+    merged = merge_ranges(list(ranges))
+    return [low for low, _ in merged], [high for _, high in merged]
+
+def is_fresh_indexed(id_value, index):
+    """Like is_fresh, but a bisect into the merged index: O(log R)."""
+    starts, ends = index
+    i = bisect_right(starts, id_value) - 1
+    return i >= 0 and id_value <= ends[i]
+
+def classify_ids_numpy(ids, index):
+    """Batch is_fresh_indexed for a whole array of IDs with searchsorted."""
+    starts = np.asarray(index[0], dtype=np.int64)
+    ends = np.asarray(index[1], dtype=np.int64)
+    ids = np.asarray(ids, dtype=np.int64)
+    if starts.size == 0:
+        return np.zeros(ids.shape, dtype=bool)
+    i = np.searchsorted(starts, ids, side='right') - 1
+    return (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+
+INDEX_MAGIC = b"D5IX"
+INDEX_HEADER = struct.Struct("<4sIQ")  # magic, version, number of ranges
+
+def write_index_file(path, index):
+    """
+    Save a merged index as a header followed by the starts and the ends,
+    each a sorted little-endian uint64 array.
+    """
+    starts, ends = index
+    with open(path, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, 1, len(starts)))
+        for values in (starts, ends):
+            values = array("Q", values)
+            if sys.byteorder == "big":
+                values.byteswap()
+            f.write(values.tobytes())
+
+def load_index_file(path):
+    """
+    Memory-map an index written by write_index_file and return (starts, ends)
+    as uint64 views straight into the mapping, so nothing is parsed. On a
+    big-endian machine the arrays are copied and byte-swapped instead.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < INDEX_HEADER.size:
+            raise ValueError(f"{path} is not a fresh-ID index file")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count = INDEX_HEADER.unpack_from(mm)
+    if magic != INDEX_MAGIC or version != 1:
+        raise ValueError(f"{path} is not a fresh-ID index file")
+    if len(mm) != INDEX_HEADER.size + 16 * count:
+        raise ValueError(f"{path} should hold {count} ranges but has {len(mm)} bytes")
+    data = memoryview(mm)[INDEX_HEADER.size:].cast("Q")
+    if sys.byteorder == "big":
+        data = array("Q", data)
+        data.byteswap()
+    return data[:count], data[count:]
+
+def stream_fresh(lines, index=None):
+    """
+    Read the range section from lines, build the index, then classify the ID
+    lines one at a time, yielding (id, fresh, fresh count so far). Only the
+    ranges are held in memory, and results arrive while lines are read.
+    If an index is passed in, the range lines are skipped unparsed.
+    """
+    lines = iter(lines)
+    ranges = []
+    first_id = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if "-" not in line:
+            first_id.append(line)
+            break
+        if index is None:
+            ranges.append(parse_range(line))
+    if index is None:
+        index = build_index(ranges)
+
+    fresh_count = 0
+    for line in chain(first_id, lines):
+        line = line.strip()
+        if not line:
+            continue
+        value = int(line)
+        fresh = is_fresh_indexed(value, index)
+        fresh_count += fresh
+        yield value, fresh, fresh_count
+
+def get_option(name):
+    """Value of a --name=value command-line option, or None."""
+    for arg in sys.argv[1:]:
+        if arg.startswith(name + "="):
+            return arg[len(name) + 1:]
+    return None
+
 def main():
     ranges = []
     ids = []
+    build_path = get_option("--build-index")
+    index_path = get_option("--index")
+
+    if "--stream" in sys.argv[1:]:
+        verdicts = "--verdicts" in sys.argv[1:]
+        index = load_index_file(index_path) if index_path else None
+        fresh_count = 0
+        with open("input.txt", "r") as f:
+            for value, fresh, fresh_count in stream_fresh(f, index):
+                if verdicts:
+                    print(value, "fresh" if fresh else "spoiled", fresh_count)
+        print("Total fresh ingredient IDs:", fresh_count)
+        return
 
     with open("input.txt", "r") as f:
         lines = [line.strip() for line in f if line.strip() != ""]
@@ -59,19 +159,30 @@ def main():
     # Find first line that is NOT a range -> that starts the IDs
     idx = 0
     while idx < len(lines) and "-" in lines[idx]:
-        ranges.append(parse_range(lines[idx]))
+        if index_path is None:
+            ranges.append(parse_range(lines[idx]))
         idx += 1
 
+    if build_path is not None:
+        write_index_file(build_path, build_index(ranges))
+        print("Index written to", build_path)
+        return
+
     # Remaining lines are ingredient IDs
     for i in range(idx, len(lines)):
         ids.append(int(lines[i]))
 
-    # Count fresh IDs
-    fresh_count = sum(1 for value in ids if is_fresh(value, ranges))
+    # Count fresh IDs against the merged index
+    index = load_index_file(index_path) if index_path else build_index(ranges)
+    if "--numpy" in sys.argv[1:]:
+        if np is None:
+            raise SystemExit("--numpy requires numpy to be installed")
+        fresh_count = int(np.count_nonzero(classify_ids_numpy(ids, index)))
+    else:
+        fresh_count = sum(1 for value in ids if is_fresh_indexed(value, index))
 
     print("Total fresh ingredient IDs:", fresh_count)
 
 
 if __name__ == "__main__":
     main()
->>>>>>> e0b85b5 (init)
@@ -1,42 +1,6 @@
-<<<<<<< HEAD
-def parse_range(line):
-    start, end = map(int, line.split("-"))
-    return (start, end)
-
-def merge_ranges(ranges):
-    # Sort by start value
-    ranges.sort(key=lambda x: x[0])
-    merged = []
-
-    for r in ranges:
-        if not merged or r[0] > merged[-1][1] + 1:
-            # No overlap
-            merged.append([r[0], r[1]])
-        else:
-            # Overlap → extend end if needed
-            merged[-1][1] = max(merged[-1][1], r[1])
-
-    return merged
-
-def main():
-    ranges = []
-
-    with open("input.txt", "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                break  # Stop at blank line
-            ranges.append(parse_range(line))
-
-    merged = merge_ranges(ranges)
-
-    total_fresh = sum((end - start + 1) for start, end in merged)
-
-    print("Total fresh ingredient IDs (Part Two):", total_fresh)
-
-if __name__ == "__main__":
-    main()
-=======
+import sys
+from bisect import bisect_left, bisect_right
+
 def parse_range(line):
     start, end = map(int, line.split("-"))
     return (start, end)
@@ -56,6 +20,71 @@ def merge_ranges(ranges):
 
     return merged
 
+class IntervalSet:
+    """
+    Mutable set of fresh IDs kept as disjoint, non-adjacent ranges in two
+    sorted lists, with the Part Two total kept up to date. add() and
+    remove() locate the k ranges they touch by bisect, so each update is
+    O(log n + k) apart from the list splice.
+    """
+
+    def __init__(self, ranges=()):
+        self.starts = []
+        self.ends = []
+        self.total = 0
+        for start, end in ranges:
+            self.add(start, end)
+
+    def add(self, start, end):
+        # every range overlapping or touching [start, end] is absorbed
+        i = bisect_left(self.ends, start - 1)
+        j = bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.total -= sum(e - s + 1 for s, e in zip(self.starts[i:j], self.ends[i:j]))
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.total += end - start + 1
+
+    def remove(self, start, end):
+        # drop IDs start..end, keeping the parts of ranges sticking out
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i >= j:
+            return
+        pieces = []
+        if self.starts[i] < start:
+            pieces.append((self.starts[i], start - 1))
+        if self.ends[j - 1] > end:
+            pieces.append((end + 1, self.ends[j - 1]))
+        self.total -= sum(e - s + 1 for s, e in zip(self.starts[i:j], self.ends[i:j]))
+        self.total += sum(e - s + 1 for s, e in pieces)
+        self.starts[i:j] = [s for s, _ in pieces]
+        self.ends[i:j] = [e for _, e in pieces]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+def apply_updates(fresh, lines):
+    """
+    Apply "add a-b" / "remove a-b" lines to an IntervalSet, yielding the
+    total number of fresh IDs after each update.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        op, _, rng = line.partition(" ")
+        start, end = parse_range(rng)
+        if op == "add":
+            fresh.add(start, end)
+        elif op == "remove":
+            fresh.remove(start, end)
+        else:
+            raise ValueError(f"Bad update: {line}")
+        yield fresh.total
+
 def main():
     ranges = []
 
@@ -66,6 +95,15 @@ def main():
                 break  # Stop at blank line
             ranges.append(parse_range(line))
 
+    updates = [arg[len("--updates="):] for arg in sys.argv[1:] if arg.startswith("--updates=")]
+    if updates:
+        fresh = IntervalSet(ranges)
+        print("Total fresh ingredient IDs (Part Two):", fresh.total)
+        with open(updates[0], "r") as f:
+            for total in apply_updates(fresh, f):
+                print(total)
+        return
+
     merged = merge_ranges(ranges)
 
     total_fresh = sum((end - start + 1) for start, end in merged)
@@ -74,4 +112,3 @@ def main():
 
 if __name__ == "__main__":
     main()
->>>>>>> e0b85b5 (init)
@@ -1,70 +1,134 @@
-<<<<<<< HEAD
-def solve_day6():
-    # Read all lines, keep raw spacing
-    lines = [line.rstrip("\n") for line in open("input.txt", "r")]
-    if not lines:
-        return 0
-
-    height = len(lines)
-    width = max(len(line) for line in lines)
-
-    # Normalize line lengths to equal width using spaces
-    grid = [line.ljust(width) for line in lines]
-
-    problems = []
-    col = 0
-
-    while col < width:
-        # Skip columns that are all spaces = separators
-        if all(grid[row][col] == " " for row in range(height)):
-            col += 1
-            continue
-
-        # Now we are inside a problem column-block
-        problem_cols = []
-        while col < width and not all(grid[row][col] == " " for row in range(height)):
-            problem_cols.append(col)
-            col += 1
-
-        problems.append(problem_cols)
-
-    total = 0
-
-    for cols in problems:
-        numbers = []
-        op = None
-
-        # For each row, check if the row contains digits or operation symbol in these columns
-        for row in range(height):
-            snippet = "".join(grid[row][c] for c in cols).strip()
-
-            if not snippet:
-                continue
-
-            if snippet.isdigit():
-                numbers.append(int(snippet))
-            elif snippet in ("+", "*"):
-                op = snippet
-
-        # Evaluate the problem
-        if op == "+":
-            ans = sum(numbers)
-        elif op == "*":
-            ans = 1
-            for n in numbers:
-                ans *= n
-        else:
-            raise ValueError("Missing operation in problem!")
-
-        total += ans
-
-    print("Grand total:", total)
-    return total
-
-
-if __name__ == "__main__":
-    solve_day6()
-=======
+import sys
+from itertools import zip_longest
+
+
+def split_problems(grid):
+    """
+    Split the padded grid into problem blocks, each a list of column indices.
+    The grid is transposed once with zip(*grid) to mark the all-space
+    separator columns in a single O(H*W) pass.
+    """
+    height = len(grid)
+    blank = [column.count(" ") == height for column in zip(*grid)]
+
+    problems = []
+    block = []
+    for col, is_blank in enumerate(blank):
+        if is_blank:
+            if block:
+                problems.append(block)
+                block = []
+        else:
+            block.append(col)
+    if block:
+        problems.append(block)
+    return problems
+
+
+def product(numbers):
+    """
+    Multiply numbers pairwise in a balanced tree. A left fold multiplies an
+    ever-growing result by small operands, which is quadratic in the result's
+    bit length; pairing keeps both operands of each multiplication similar.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+    while len(numbers) > 1:
+        paired = [a * b for a, b in zip(numbers[::2], numbers[1::2])]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def evaluate_problem(rows):
+    """Evaluate one problem block given its text in each row."""
+    numbers = []
+    op = None
+
+    # For each row, check if the row contains digits or operation symbol in these columns
+    for row in rows:
+        snippet = row.strip()
+
+        if not snippet:
+            continue
+
+        if snippet.isdigit():
+            numbers.append(int(snippet))
+        elif snippet in ("+", "*"):
+            op = snippet
+
+    # Evaluate the problem
+    if op == "+":
+        return sum(numbers)
+    elif op == "*":
+        return product(numbers)
+    else:
+        raise ValueError("Missing operation in problem!")
+
+
+def row_spans(path, buffer_size=1 << 16):
+    """(start, end) byte offsets of every row, found with a bounded buffer."""
+    spans = []
+    start = offset = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(buffer_size)
+            if not chunk:
+                break
+            pos = chunk.find(b"\n")
+            while pos != -1:
+                spans.append((start, offset + pos))
+                start = offset + pos + 1
+                pos = chunk.find(b"\n", pos + 1)
+            offset += len(chunk)
+        if start < offset:
+            spans.append((start, offset))
+        # drop the '\r' of '\r\n' line endings
+        for i, (start, end) in enumerate(spans):
+            if end > start:
+                f.seek(end - 1)
+                if f.read(1) == b"\r":
+                    spans[i] = (start, end - 1)
+    return spans
+
+
+def row_chars(path, start, end, buffer_size=1 << 16):
+    """Characters of one row, read through its own handle and bounded buffer."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(buffer_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield from chunk.decode("ascii")
+
+
+def iter_column_blocks(path, buffer_size=1 << 16):
+    """
+    Stream the worksheet's problem blocks left to right without holding the
+    grid: every row gets its own file handle and read-ahead buffer, and the
+    rows advance in lockstep one column at a time (short rows read as
+    spaces). Each block, a list of columns top to bottom, is yielded as soon
+    as the separator column after it is reached.
+    """
+    rows = [row_chars(path, start, end, buffer_size)
+            for start, end in row_spans(path, buffer_size)]
+    block = []
+    for column in zip_longest(*rows, fillvalue=" "):
+        if column.count(" ") == len(column):
+            if block:
+                yield block
+                block = []
+        else:
+            block.append(column)
+    if block:
+        yield block
+
+
 def solve_day6():
     # Read all lines, keep raw spacing
     lines = [line.rstrip("\n") for line in open("input.txt", "r")]
@@ -77,57 +141,31 @@ def solve_day6():
     # Normalize line lengths to equal width using spaces
     grid = [line.ljust(width) for line in lines]
 
-    problems = []
-    col = 0
-
-    while col < width:
-        # Skip columns that are all spaces = separators
-        if all(grid[row][col] == " " for row in range(height)):
-            col += 1
-            continue
-
-        # Now we are inside a problem column-block
-        problem_cols = []
-        while col < width and not all(grid[row][col] == " " for row in range(height)):
-            problem_cols.append(col)
-            col += 1
-
-        problems.append(problem_cols)
+    # Column blocks between all-space separator columns
+    problems = split_problems(grid)
 
     total = 0
 
     for cols in problems:
-        numbers = []
-        op = None
-
-        # For each row, check if the row contains digits or operation symbol in these columns
-        for row in range(height):
-            snippet = "".join(grid[row][c] for c in cols).strip()
-
-            if not snippet:
-                continue
-
-            if snippet.isdigit():
-                numbers.append(int(snippet))
-            elif snippet in ("+", "*"):
-                op = snippet
-
-        # Evaluate the problem
-        if op == "+":
-            ans = sum(numbers)
-        elif op == "*":
-            ans = 1
-            for n in numbers:
-                ans *= n
-        else:
-            raise ValueError("Missing operation in problem!")
+        # The block's text in each row
+        rows = [grid[row][cols[0]:cols[-1] + 1] for row in range(height)]
+        total += evaluate_problem(rows)
 
-        total += ans
+    print("Grand total:", total)
+    return total
+
+
+def solve_day6_stream(path="input.txt"):
+    total = 0
+    for block in iter_column_blocks(path):
+        total += evaluate_problem(["".join(row) for row in zip(*block)])
 
     print("Grand total:", total)
     return total
 
 
 if __name__ == "__main__":
-    solve_day6()
->>>>>>> e0b85b5 (init)
+    if "--stream" in sys.argv[1:]:
+        solve_day6_stream()
+    else:
+        solve_day6()
@@ -1,80 +1,129 @@
-<<<<<<< HEAD
-def solve_day6_part2():
-    lines = [line.rstrip("\n") for line in open("input.txt", "r")]
-    height = len(lines)
-    width = max(len(line) for line in lines)
-
-    # Pad all lines to uniform width
-    grid = [line.ljust(width) for line in lines]
-
-    # Identify column groups (problems)
-    problems = []
-    col = 0
-    while col < width:
-        # Skip separator columns
-        if all(grid[r][col] == " " for r in range(height)):
-            col += 1
-            continue
-
-        # Now inside a problem-block
-        block = []
-        while col < width and not all(grid[r][col] == " " for r in range(height)):
-            block.append(col)
-            col += 1
-
-        problems.append(block)
-
-    total = 0
-
-    for block in problems:
-        # Reverse block columns (read right → left)
-        block = list(reversed(block))
-
-        digits_per_number = []
-        op = None
-
-        # Determine operator in the bottom row for this block
-        bottom_row = height - 1
-        snippet = "".join(grid[bottom_row][c] for c in block).strip()
-        op = snippet  # must be '+' or '*'
-
-        # Extract the columns above the operator row
-        rows_for_digits = range(0, bottom_row)
-
-        # Build numbers column-by-column (right→left)
-        numbers = []
-        for col_idx in range(len(block)):
-            column = block[col_idx]
-
-            digits = []
-            for r in rows_for_digits:
-                ch = grid[r][column]
-                if ch.isdigit():
-                    digits.append(ch)
-
-            if digits:
-                number = int("".join(digits))
-                numbers.append(number)
-
-        # Evaluate problem
-        if op == "+":
-            value = sum(numbers)
-        elif op == "*":
-            value = 1
-            for n in numbers:
-                value *= n
-        else:
-            raise ValueError("Invalid operator: " + op)
-
-        total += value
-
-    print("Grand total (Part Two):", total)
-    return total
-
-
-if __name__ == "__main__":
-    solve_day6_part2()
-=======
+import sys
+from itertools import zip_longest
+
+
+def split_problems(grid):
+    """
+    Split the padded grid into problem blocks, each a list of column indices.
+    The grid is transposed once with zip(*grid) to mark the all-space
+    separator columns in a single O(H*W) pass.
+    """
+    height = len(grid)
+    blank = [column.count(" ") == height for column in zip(*grid)]
+
+    problems = []
+    block = []
+    for col, is_blank in enumerate(blank):
+        if is_blank:
+            if block:
+                problems.append(block)
+                block = []
+        else:
+            block.append(col)
+    if block:
+        problems.append(block)
+    return problems
+
+
+def product(numbers):
+    """
+    Multiply numbers pairwise in a balanced tree. A left fold multiplies an
+    ever-growing result by small operands, which is quadratic in the result's
+    bit length; pairing keeps both operands of each multiplication similar.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+    while len(numbers) > 1:
+        paired = [a * b for a, b in zip(numbers[::2], numbers[1::2])]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def evaluate_problem(columns):
+    """Evaluate one problem block given its columns, each read top to bottom."""
+    # Determine operator in the bottom row for this block
+    op = "".join(column[-1] for column in columns).strip()  # must be '+' or '*'
+
+    # Build numbers column-by-column (right→left) from the rows above the operator row
+    numbers = []
+    for column in reversed(columns):
+        digits = [ch for ch in column[:-1] if ch.isdigit()]
+        if digits:
+            numbers.append(int("".join(digits)))
+
+    # Evaluate problem
+    if op == "+":
+        return sum(numbers)
+    elif op == "*":
+        return product(numbers)
+    else:
+        raise ValueError("Invalid operator: " + op)
+
+
+def row_spans(path, buffer_size=1 << 16):
+    """(start, end) byte offsets of every row, found with a bounded buffer."""
+    spans = []
+    start = offset = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(buffer_size)
+            if not chunk:
+                break
+            pos = chunk.find(b"\n")
+            while pos != -1:
+                spans.append((start, offset + pos))
+                start = offset + pos + 1
+                pos = chunk.find(b"\n", pos + 1)
+            offset += len(chunk)
+        if start < offset:
+            spans.append((start, offset))
+        # drop the '\r' of '\r\n' line endings
+        for i, (start, end) in enumerate(spans):
+            if end > start:
+                f.seek(end - 1)
+                if f.read(1) == b"\r":
+                    spans[i] = (start, end - 1)
+    return spans
+
+
+def row_chars(path, start, end, buffer_size=1 << 16):
+    """Characters of one row, read through its own handle and bounded buffer."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(buffer_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield from chunk.decode("ascii")
+
+
+def iter_column_blocks(path, buffer_size=1 << 16):
+    """
+    Stream the worksheet's problem blocks left to right without holding the
+    grid: every row gets its own file handle and read-ahead buffer, and the
+    rows advance in lockstep one column at a time (short rows read as
+    spaces). Each block, a list of columns top to bottom, is yielded as soon
+    as the separator column after it is reached.
+    """
+    rows = [row_chars(path, start, end, buffer_size)
+            for start, end in row_spans(path, buffer_size)]
+    block = []
+    for column in zip_longest(*rows, fillvalue=" "):
+        if column.count(" ") == len(column):
+            if block:
+                yield block
+                block = []
+        else:
+            block.append(column)
+    if block:
+        yield block
+
+
 def solve_day6_part2():
     lines = [line.rstrip("\n") for line in open("input.txt", "r")]
     height = len(lines)
@@ -84,70 +133,30 @@ def solve_day6_part2():
     grid = [line.ljust(width) for line in lines]
 
     # Identify column groups (problems)
-    problems = []
-    col = 0
-    while col < width:
-        # Skip separator columns
-        if all(grid[r][col] == " " for r in range(height)):
-            col += 1
-            continue
-
-        # Now inside a problem-block
-        block = []
-        while col < width and not all(grid[r][col] == " " for r in range(height)):
-            block.append(col)
-            col += 1
-
-        problems.append(block)
+    problems = split_problems(grid)
 
     total = 0
 
     for block in problems:
-        # Reverse block columns (read right → left)
-        block = list(reversed(block))
-
-        digits_per_number = []
-        op = None
-
-        # Determine operator in the bottom row for this block
-        bottom_row = height - 1
-        snippet = "".join(grid[bottom_row][c] for c in block).strip()
-        op = snippet  # must be '+' or '*'
-
-        # Extract the columns above the operator row
-        rows_for_digits = range(0, bottom_row)
-
-        # Build numbers column-by-column (right→left)
-        numbers = []
-        for col_idx in range(len(block)):
-            column = block[col_idx]
-
-            digits = []
-            for r in rows_for_digits:
-                ch = grid[r][column]
-                if ch.isdigit():
-                    digits.append(ch)
-
-            if digits:
-                number = int("".join(digits))
-                numbers.append(number)
-
-        # Evaluate problem
-        if op == "+":
-            value = sum(numbers)
-        elif op == "*":
-            value = 1
-            for n in numbers:
-                value *= n
-        else:
-            raise ValueError("Invalid operator: " + op)
+        # The block's columns, each read top to bottom
+        columns = ["".join(grid[r][c] for r in range(height)) for c in block]
+        total += evaluate_problem(columns)
 
-        total += value
+    print("Grand total (Part Two):", total)
+    return total
+
+
+def solve_day6_part2_stream(path="input.txt"):
+    total = 0
+    for block in iter_column_blocks(path):
+        total += evaluate_problem(["".join(column) for column in block])
 
     print("Grand total (Part Two):", total)
     return total
 
 
 if __name__ == "__main__":
-    solve_day6_part2()
->>>>>>> e0b85b5 (init)
+    if "--stream" in sys.argv[1:]:
+        solve_day6_part2_stream()
+    else:
+        solve_day6_part2()
@@ -1,70 +1,3 @@
-<<<<<<< HEAD
-from collections import deque
-
-def count_splits_from_file(path="input.txt"):
-    # Read grid (preserve spacing)
-    with open(path, "r") as f:
-        lines = [line.rstrip("\n") for line in f]
-    if not lines:
-        return 0
-
-    H = len(lines)
-    W = max(len(l) for l in lines)
-    grid = [l.ljust(W, " ") for l in lines]
-
-    # find S
-    S_row = S_col = None
-    for r in range(H):
-        c = grid[r].find("S")
-        if c != -1:
-            S_row, S_col = r, c
-            break
-    if S_row is None:
-        raise ValueError("No S found in input")
-
-    # BFS/stack of beam positions (row, col) representing the current cell the beam occupies
-    start = (S_row + 1, S_col)  # beam begins directly below S
-    queue = deque([start])
-
-    visited = set()            # cells we've already processed for a beam
-    splitters_counted = set()  # splitter coordinates we've already counted
-    splits = 0
-
-    while queue:
-        r, c = queue.popleft()
-
-        # out of bounds or already processed
-        if not (0 <= c < W and 0 <= r < H):
-            continue
-        if (r, c) in visited:
-            continue
-        visited.add((r, c))
-
-        ch = grid[r][c]
-
-        # treat spaces as empty (beam passes through until it goes off-grid)
-        if ch == "^":
-            # beam hits splitter: it stops here, and spawns new beams immediately
-            if (r, c) not in splitters_counted:
-                splits += 1
-                splitters_counted.add((r, c))
-            # spawn left and right beams starting at the same row (immediate left/right of splitter)
-            left = (r, c - 1)
-            right = (r, c + 1)
-            if 0 <= left[1] < W:
-                queue.append(left)
-            if 0 <= right[1] < W:
-                queue.append(right)
-        else:
-            # empty / S / . / space: beam continues downward
-            queue.append((r + 1, c))
-
-    return splits
-
-if __name__ == "__main__":
-    result = count_splits_from_file("input.txt")
-    print("Total beam splits:", result)
-=======
 from collections import deque
 
 def count_splits_from_file(path="input.txt"):
@@ -127,7 +60,52 @@ def count_splits_from_file(path="input.txt"):
 
     return splits
 
+SPLITTER_BITS = bytes(ord("1") if b == ord("^") else ord("0") for b in range(256))
+
+def splitter_mask(row):
+    """Bit c is set when column c of the row holds a splitter."""
+    return int(row[::-1].encode().translate(SPLITTER_BITS), 2) if row else 0
+
+def popcount(x):
+    return bin(x).count("1")
+
+def count_splits_bitset(path="input.txt"):
+    """
+    Same count as count_splits_from_file, one row at a time: the active beam
+    columns of a row are a single int, so the splitters hit are
+    beams & splitters and the beams spawned beside them are two shifts.
+    """
+    with open(path, "r") as f:
+        lines = [line.rstrip("\n") for line in f]
+    if not lines:
+        return 0
+
+    H = len(lines)
+    W = max(len(l) for l in lines)
+    full = (1 << W) - 1
+
+    S_row = next((r for r, l in enumerate(lines) if "S" in l), None)
+    if S_row is None:
+        raise ValueError("No S found in input")
+
+    beams = 1 << lines[S_row].find("S")  # beam begins directly below S
+    splits = 0
+    for r in range(S_row + 1, H):
+        if not beams:
+            break
+        splitters = splitter_mask(lines[r])
+        # cells the beams reach in this row; spawned beams that land on
+        # another splitter split again
+        active = frontier = beams
+        while frontier:
+            hit = frontier & splitters
+            frontier = ((hit << 1) | (hit >> 1)) & full & ~active
+            active |= frontier
+        splits += popcount(active & splitters)
+        beams = active & ~splitters
+
+    return splits
+
 if __name__ == "__main__":
-    result = count_splits_from_file("input.txt")
+    result = count_splits_bitset("input.txt")
     print("Total beam splits:", result)
->>>>>>> e0b85b5 (init)
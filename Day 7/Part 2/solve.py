@@ -1,148 +1,4 @@
-<<<<<<< HEAD
-from collections import deque, defaultdict
-
-def read_grid(path="input.txt"):
-    with open(path, "r") as f:
-        lines = [line.rstrip("\n") for line in f]
-    if not lines:
-        return [], 0, 0
-    H = len(lines)
-    W = max(len(l) for l in lines)
-    grid = [l.ljust(W, " ") for l in lines]
-    return grid, H, W
-
-def find_start(grid, H, W):
-    for r in range(H):
-        c = grid[r].find("S")
-        if c != -1:
-            return (r + 1, c)   # beam/particle begins just below S
-    raise ValueError("No S found in input")
-
-def outgoing(cell, grid, H, W):
-    """Return list of neighbor cells (r,c) inside grid, and count of edges that go out-of-bounds."""
-    r, c = cell
-    # If current cell itself is out of bounds - caller shouldn't ask this, treat as no outgoing.
-    if not (0 <= r < H and 0 <= c < W):
-        return [], 0
-
-    ch = grid[r][c]
-    outs = []
-    exits = 0
-
-    if ch == "^":
-        # splitter: spawns to immediate left and right on the same row
-        for nc in (c - 1, c + 1):
-            if 0 <= nc < W:
-                outs.append((r, nc))
-            else:
-                exits += 1
-    else:
-        # normal: continues downward
-        nr, nc = r + 1, c
-        if 0 <= nr < H and 0 <= nc < W:
-            outs.append((nr, nc))
-        else:
-            exits += 1
-
-    return outs, exits
-
-def build_graph_and_reachable(start, grid, H, W):
-    """BFS to find reachable nodes and build adjacency and exit-edge counts."""
-    q = deque([start])
-    seen = set([start])
-    adj = defaultdict(list)
-    exit_edges = defaultdict(int)  # exit_edges[node] = number of edges from node that go out-of-bounds
-
-    while q:
-        node = q.popleft()
-        nbrs, exits = outgoing(node, grid, H, W)
-        exit_edges[node] = exits
-        for v in nbrs:
-            adj[node].append(v)
-            if v not in seen:
-                seen.add(v)
-                q.append(v)
-
-    return adj, exit_edges, seen
-
-def detect_cycle(adj, nodes):
-    """Detect cycle in directed graph restricted to 'nodes' using DFS (white/gray/black)."""
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color = {n: WHITE for n in nodes}
-
-    def dfs(u):
-        color[u] = GRAY
-        for v in adj.get(u, ()):
-            if v not in color:
-                continue
-            if color[v] == GRAY:
-                return True
-            if color[v] == WHITE and dfs(v):
-                return True
-        color[u] = BLACK
-        return False
-
-    for n in nodes:
-        if color[n] == WHITE:
-            if dfs(n):
-                return True
-    return False
-
-def count_timelines(path="input.txt"):
-    grid, H, W = read_grid(path)
-    if H == 0:
-        return 0
-
-    start = find_start(grid, H, W)
-    adj, exit_edges, nodes = build_graph_and_reachable(start, grid, H, W)
-
-    # If no nodes (start might be out of bounds), then zero timelines
-    if not nodes:
-        return 0
-
-    # detect cycles (would imply infinite timelines)
-    if detect_cycle(adj, nodes):
-        raise RuntimeError("Cycle detected in reachable graph: timelines would be infinite.")
-
-    # Topological order (Kahn). Compute indegrees for reachable subgraph.
-    indeg = {n: 0 for n in nodes}
-    for u in nodes:
-        for v in adj.get(u, ()):
-            if v in indeg:
-                indeg[v] += 1
-
-    # Kahn's queue
-    q = deque([n for n in nodes if indeg[n] == 0])
-    topo = []
-    while q:
-        u = q.popleft()
-        topo.append(u)
-        for v in adj.get(u, ()):
-            if v in indeg:
-                indeg[v] -= 1
-                if indeg[v] == 0:
-                    q.append(v)
-
-    # DP: number of ways to reach each node (big integers)
-    ways = defaultdict(int)
-    ways[start] = 1
-    total_exits = 0
-
-    # Process nodes in topological order and propagate
-    for u in topo:
-        w = ways[u]
-        # edges that go out-of-bounds contribute to final timelines
-        if exit_edges.get(u, 0):
-            total_exits += w * exit_edges[u]
-        for v in adj.get(u, ()):
-            ways[v] += w
-
-    return total_exits
-
-if __name__ == "__main__":
-    result = count_timelines("input.txt")
-    print("Total timelines:", result)
-=======
+import sys
 from collections import deque, defaultdict
 
 def read_grid(path="input.txt"):
@@ -283,7 +139,178 @@ def count_timelines(path="input.txt"):
 
     return total_exits
 
+def sweep_row(row, counts):
+    """
+    Push the timeline counts entering a row (one per column) through it.
+    Returns the counts entering the next row and the number of timelines that
+    left the grid sideways. A splitter sends its count to both neighbours,
+    which then continue down; a neighbour that is itself a splitter would
+    bounce the beam back forever, so that is reported as a cycle.
+    """
+    W = len(counts)
+    nxt = [0] * W
+    exits = 0
+    for c, k in enumerate(counts):
+        if not k:
+            continue
+        if row[c] == "^":
+            for nc in (c - 1, c + 1):
+                if not 0 <= nc < W:
+                    exits += k
+                elif row[nc] == "^":
+                    raise RuntimeError("Cycle detected in reachable graph: timelines would be infinite.")
+                else:
+                    nxt[nc] += k
+        else:
+            nxt[c] += k
+    return nxt, exits
+
+def count_timelines_sweep(path="input.txt"):
+    """
+    Same answer as count_timelines without building a graph: beams only move
+    down, or sideways on splitter rows, so one top-to-bottom sweep with an
+    array of W counts is enough. O(W) per row, no recursion.
+    """
+    grid, H, W = read_grid(path)
+    if H == 0:
+        return 0
+
+    start_row, start_col = find_start(grid, H, W)
+    counts = [0] * W
+    counts[start_col] = 1
+    total_exits = 0
+    for r in range(start_row, H):
+        counts, exits = sweep_row(grid[r], counts)
+        total_exits += exits
+
+    # whatever is still moving falls out of the bottom
+    if start_row < H:
+        total_exits += sum(counts)
+    return total_exits
+
+def count_timelines_all_columns(path="input.txt"):
+    """
+    Timelines for a beam starting in every column of the start row (the row
+    below S, or the top row if there is no S) from a single bottom-up pass:
+    a cell's count is the sum over its successors, and leaving the grid
+    counts as one timeline. O(W) per row instead of W separate runs.
+    Columns whose beam would hit a splitter next to a splitter (an
+    infinite cycle) get None. Returns a list of W counts.
+    """
+    grid, H, W = read_grid(path)
+    if H == 0:
+        return []
+
+    start_row = next((r + 1 for r in range(H) if "S" in grid[r]), 0)
+    if start_row >= H:
+        return [0] * W
+
+    below = [1] * W  # a beam under the last row has left the grid
+    for r in range(H - 1, start_row - 1, -1):
+        row = grid[r]
+        cur = []
+        for c in range(W):
+            if row[c] != "^":
+                cur.append(below[c])
+                continue
+            total = 0
+            for nc in (c - 1, c + 1):
+                if not 0 <= nc < W:
+                    v = 1
+                elif row[nc] == "^":
+                    v = None
+                else:
+                    v = below[nc]
+                total = None if v is None or total is None else total + v
+            cur.append(total)
+        below = cur
+    return below
+
+SPLITTER_BITS = bytes(ord("1") if b == ord("^") else ord("0") for b in range(256))
+
+def splitter_mask(row):
+    """Bit c is set when column c of the row holds a splitter."""
+    return int(row[::-1].encode().translate(SPLITTER_BITS), 2) if row else 0
+
+def popcount(x):
+    return bin(x).count("1")
+
+def stream_manifold(lines):
+    """
+    Part 1 and Part 2 in a single pass over an iterable of rows (an open
+    file or any iterator), keeping only the current row's beam state: a
+    beam bitset for the split count and a list of per-column timeline
+    counts. Memory depends on the width only. Returns (splits, timelines).
+
+    The grid width is not known up front, so nothing is clipped on the
+    right: a beam spilling past the widest row only ever falls straight down
+    (no row has a splitter there) and is counted as leaving either way.
+    """
+    lines = iter(lines)
+    for line in lines:
+        start_col = line.find("S")
+        if start_col != -1:
+            break
+    else:
+        raise ValueError("No S found in input")
+
+    beams = 1 << start_col  # beam begins directly below S
+    counts = [0] * start_col + [1]
+    splits = 0
+    exits = 0
+    rows_seen = False
+    for line in lines:
+        row = line.rstrip("\r\n")
+        rows_seen = True
+
+        # Part 1: same propagation as count_splits_bitset
+        splitters = splitter_mask(row)
+        active = frontier = beams
+        while frontier:
+            hit = frontier & splitters
+            frontier = ((hit << 1) | (hit >> 1)) & ~active
+            active |= frontier
+        splits += popcount(active & splitters)
+        beams = active & ~splitters
+
+        # Part 2: sweep_row with an open right edge
+        nxt = [0] * (len(counts) + 1)
+        for c, k in enumerate(counts):
+            if not k:
+                continue
+            if c < len(row) and row[c] == "^":
+                for nc in (c - 1, c + 1):
+                    if nc < 0:
+                        exits += k
+                    elif nc < len(row) and row[nc] == "^":
+                        raise RuntimeError("Cycle detected in reachable graph: timelines would be infinite.")
+                    else:
+                        nxt[nc] += k
+            else:
+                nxt[c] += k
+        while nxt and not nxt[-1]:
+            nxt.pop()
+        counts = nxt
+
+    # whatever is still moving falls out of the bottom
+    timelines = exits + sum(counts) if rows_seen else 0
+    return splits, timelines
+
 if __name__ == "__main__":
-    result = count_timelines("input.txt")
-    print("Total timelines:", result)
->>>>>>> e0b85b5 (init)
+    stream = [arg for arg in sys.argv[1:] if arg.startswith("--stream")]
+    if "--all-columns" in sys.argv[1:]:
+        for col, result in enumerate(count_timelines_all_columns("input.txt")):
+            print(col, "infinite" if result is None else result)
+    elif stream:
+        # --stream reads input.txt, --stream=- reads stdin
+        _, _, path = stream[0].partition("=")
+        if path == "-":
+            splits, result = stream_manifold(sys.stdin)
+        else:
+            with open(path or "input.txt", "r") as f:
+                splits, result = stream_manifold(f)
+        print("Total beam splits:", splits)
+        print("Total timelines:", result)
+    else:
+        result = count_timelines_sweep("input.txt")
+        print("Total timelines:", result)
@@ -1,73 +1,5 @@
-<<<<<<< HEAD
-import math
-from heapq import nsmallest
-
-class DSU:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.size = [1] * n
-
-    def find(self, x):
-        while x != self.parent[x]:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
-        return x
-
-    def union(self, a, b):
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return False
-        if self.size[ra] < self.size[rb]:
-            ra, rb = rb, ra
-        self.parent[rb] = ra
-        self.size[ra] += self.size[rb]
-        return True
-
-def dist(a, b):
-    return math.sqrt(
-        (a[0] - b[0]) ** 2 +
-        (a[1] - b[1]) ** 2 +
-        (a[2] - b[2]) ** 2
-    )
-
-# ---- Read input ----
-pts = []
-with open("input.txt") as f:
-    for line in f:
-        if "," in line:
-            x, y, z = map(int, line.strip().split(","))
-            pts.append((x, y, z))
-
-n = len(pts)
-edges = []
-
-# ---- Compute all pair distances ----
-for i in range(n):
-    for j in range(i + 1, n):
-        d = dist(pts[i], pts[j])
-        edges.append((d, i, j))
-
-# ---- Select the 1000 smallest distances ----
-closest = nsmallest(1000, edges, key=lambda x: x[0])
-
-# ---- Union DSU ----
-dsu = DSU(n)
-for _, a, b in closest:
-    dsu.union(a, b)
-
-# ---- Count circuit sizes ----
-components = {}
-for i in range(n):
-    r = dsu.find(i)
-    components.setdefault(r, 0)
-    components[r] += 1
-
-sizes = sorted(components.values(), reverse=True)
-answer = sizes[0] * sizes[1] * sizes[2]
-
-print("Answer:", answer)
-=======
 import math
+import sys
 from heapq import nsmallest
 
 class DSU:
@@ -98,6 +30,92 @@ def dist(a, b):
         (a[2] - b[2]) ** 2
     )
 
+def grid_cells(pts, r):
+    """Bucket point indices by their cell in a uniform grid of cell size r."""
+    cells = {}
+    for i, (x, y, z) in enumerate(pts):
+        cells.setdefault((x // r, y // r, z // r), []).append(i)
+    return cells
+
+def same_cell_pairs(pts, r):
+    """Number of pairs that share a cell in the grid of cell size r."""
+    return sum(len(c) * (len(c) - 1) // 2 for c in grid_cells(pts, r).values())
+
+def initial_radius(pts, k):
+    """
+    A radius with roughly k pairs inside it, judged from how the points fill
+    the grid rather than from their bounding box, so a few far-away points
+    cannot blow it up. Starting from the guess for points spread evenly
+    over the box, it searches for the largest cell size whose single cells
+    hold at most k pairs.
+    """
+    n = len(pts)
+    spans = [max(p[axis] for p in pts) - min(p[axis] for p in pts) + 1 for axis in range(3)]
+    r = int((k * math.prod(spans) / (n * n / 2) * 3 / (4 * math.pi)) ** (1 / 3)) + 1
+    while r > 1 and same_cell_pairs(pts, r) > k:
+        r //= 2
+    while 2 * r <= max(spans) and same_cell_pairs(pts, 2 * r) <= k:
+        r *= 2
+    # then narrow down between r and 2r, to within a sixteenth
+    step = r
+    for _ in range(4):
+        step //= 2
+        if step and same_cell_pairs(pts, r + step) <= k:
+            r += step
+    return r
+
+# the cell itself plus the 13 of its 26 neighbours that come after it, so
+# each pair of neighbouring cells is visited once
+FORWARD = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+           if (dx, dy, dz) >= (0, 0, 0)]
+
+def candidate_edges(pts, r):
+    """
+    Yield every pair (squared distance, i, j) with i < j and distance <= r.
+    With a uniform grid of cell size r, a point's partners all lie in its
+    own or a neighbouring cell, so only those are searched.
+    """
+    cells = grid_cells(pts, r)
+    r2 = r * r
+    for (cx, cy, cz), members in cells.items():
+        for dx, dy, dz in FORWARD:
+            same = (dx, dy, dz) == (0, 0, 0)
+            others = members if same else cells.get((cx + dx, cy + dy, cz + dz))
+            if not others:
+                continue
+            for i in members:
+                a = pts[i]
+                for j in others:
+                    if same and j <= i:
+                        continue
+                    b = pts[j]
+                    d2 = (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
+                    if d2 <= r2:
+                        yield (d2, i, j) if i < j else (d2, j, i)
+
+def covers_all_pairs(pts, r):
+    """True once r is at least the bounding-box diagonal, i.e. every pair is a candidate."""
+    return r * r >= sum((max(p[axis] for p in pts) - min(p[axis] for p in pts)) ** 2
+                        for axis in range(3))
+
+def shortest_edges(pts, k):
+    """
+    The k shortest pairs (squared distance, i, j), in the same order as
+    sorting all pairs. Every pair within the radius is a candidate, so once
+    at least k of them are found the k smallest are exact; otherwise the
+    radius is doubled.
+    """
+    n = len(pts)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return []
+    r = initial_radius(pts, k)
+    while True:
+        edges = list(candidate_edges(pts, r))
+        if len(edges) >= k or covers_all_pairs(pts, r):
+            return nsmallest(k, edges)
+        r *= 2
+
 # ---- Read input ----
 pts = []
 with open("input.txt") as f:
@@ -107,16 +125,21 @@ with open("input.txt") as f:
             pts.append((x, y, z))
 
 n = len(pts)
-edges = []
 
-# ---- Compute all pair distances ----
-for i in range(n):
-    for j in range(i + 1, n):
-        d = dist(pts[i], pts[j])
-        edges.append((d, i, j))
+if "--all-pairs" in sys.argv[1:]:
+    edges = []
+
+    # ---- Compute all pair distances ----
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = dist(pts[i], pts[j])
+            edges.append((d, i, j))
 
-# ---- Select the 1000 smallest distances ----
-closest = nsmallest(1000, edges, key=lambda x: x[0])
+    # ---- Select the 1000 smallest distances ----
+    closest = nsmallest(1000, edges, key=lambda x: x[0])
+else:
+    # ---- Only pairs near each other, from a uniform grid ----
+    closest = shortest_edges(pts, 1000)
 
 # ---- Union DSU ----
 dsu = DSU(n)
@@ -134,4 +157,3 @@ sizes = sorted(components.values(), reverse=True)
 answer = sizes[0] * sizes[1] * sizes[2]
 
 print("Answer:", answer)
->>>>>>> e0b85b5 (init)
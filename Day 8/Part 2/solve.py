@@ -1,89 +1,5 @@
-<<<<<<< HEAD
-# day8_part2.py
-import sys
-from math import inf
-
-class DSU:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.size = [1]*n
-        self.components = n
-
-    def find(self, x):
-        while x != self.parent[x]:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
-        return x
-
-    def union(self, a, b):
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return False
-        if self.size[ra] < self.size[rb]:
-            ra, rb = rb, ra
-        self.parent[rb] = ra
-        self.size[ra] += self.size[rb]
-        self.components -= 1
-        return True
-
-def read_points(path="input.txt"):
-    pts = []
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            if "," in line:
-                x,y,z = map(int, line.split(","))
-                pts.append((x,y,z))
-    return pts
-
-def squared_dist(a, b):
-    return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
-
-def find_last_connection_product(path="input.txt"):
-    pts = read_points(path)
-    n = len(pts)
-    if n <= 1:
-        print("Not enough points.")
-        return None
-
-    # Build all edges (squared distance, i, j)
-    edges = []
-    for i in range(n):
-        for j in range(i+1, n):
-            d2 = squared_dist(pts[i], pts[j])
-            edges.append((d2, i, j))
-
-    # Sort edges by distance (ascending)
-    edges.sort(key=lambda x: x[0])
-
-    dsu = DSU(n)
-    last_pair = None
-
-    for d2, i, j in edges:
-        merged = dsu.union(i, j)
-        if merged:
-            # this union decreased component count
-            last_pair = (i, j)
-            if dsu.components == 1:
-                # this was the edge that connected everything
-                x1 = pts[i][0]
-                x2 = pts[j][0]
-                product = x1 * x2
-                print("Last connection merged indices:", i, j)
-                print("Coordinates:", pts[i], pts[j])
-                print("Product of X coordinates:", product)
-                return product
-
-    # If we finish and components > 1 (shouldn't happen), return None
-    print("Warning: graph did not become fully connected.")
-    return None
-
-if __name__ == "__main__":
-    find_last_connection_product("input.txt")
-=======
 # day8_part2.py
+import math
 import sys
 from math import inf
 
@@ -125,6 +41,207 @@ def read_points(path="input.txt"):
 def squared_dist(a, b):
     return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
 
+def grid_cells(pts, r):
+    """Bucket point indices by their cell in a uniform grid of cell size r."""
+    cells = {}
+    for i, (x, y, z) in enumerate(pts):
+        cells.setdefault((x // r, y // r, z // r), []).append(i)
+    return cells
+
+def same_cell_pairs(pts, r):
+    """Number of pairs that share a cell in the grid of cell size r."""
+    return sum(len(c) * (len(c) - 1) // 2 for c in grid_cells(pts, r).values())
+
+def initial_radius(pts, k):
+    """
+    A radius with roughly k pairs inside it, judged from how the points fill
+    the grid rather than from their bounding box, so a few far-away points
+    cannot blow it up. Starting from the guess for points spread evenly
+    over the box, it searches for the largest cell size whose single cells
+    hold at most k pairs.
+    """
+    n = len(pts)
+    spans = [max(p[axis] for p in pts) - min(p[axis] for p in pts) + 1 for axis in range(3)]
+    r = int((k * math.prod(spans) / (n * n / 2) * 3 / (4 * math.pi)) ** (1 / 3)) + 1
+    while r > 1 and same_cell_pairs(pts, r) > k:
+        r //= 2
+    while 2 * r <= max(spans) and same_cell_pairs(pts, 2 * r) <= k:
+        r *= 2
+    # then narrow down between r and 2r, to within a sixteenth
+    step = r
+    for _ in range(4):
+        step //= 2
+        if step and same_cell_pairs(pts, r + step) <= k:
+            r += step
+    return r
+
+# the cell itself plus the 13 of its 26 neighbours that come after it, so
+# each pair of neighbouring cells is visited once
+FORWARD = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+           if (dx, dy, dz) >= (0, 0, 0)]
+
+def candidate_edges(pts, r):
+    """
+    Yield every pair (squared distance, i, j) with i < j and distance <= r.
+    With a uniform grid of cell size r, a point's partners all lie in its
+    own or a neighbouring cell, so only those are searched.
+    """
+    cells = grid_cells(pts, r)
+    r2 = r * r
+    for (cx, cy, cz), members in cells.items():
+        for dx, dy, dz in FORWARD:
+            same = (dx, dy, dz) == (0, 0, 0)
+            others = members if same else cells.get((cx + dx, cy + dy, cz + dz))
+            if not others:
+                continue
+            for i in members:
+                a = pts[i]
+                for j in others:
+                    if same and j <= i:
+                        continue
+                    b = pts[j]
+                    d2 = (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
+                    if d2 <= r2:
+                        yield (d2, i, j) if i < j else (d2, j, i)
+
+class KDTree:
+    """
+    A k-d tree over the points for nearest-outside queries. After
+    set_labels, every node knows the component its points share (or -1 if
+    they are mixed), so a query skips whole subtrees of its own component.
+    """
+    LEAF_SIZE = 8
+
+    def __init__(self, pts):
+        self.pts = pts
+        self.order = list(range(len(pts)))
+        # per node: (lo, hi, box mins, box maxs, left, right); children
+        # always come after their parent
+        self.nodes = []
+        self._build(0, len(pts))
+
+    def _build(self, lo, hi):
+        idx = self.order[lo:hi]
+        mins = tuple(min(self.pts[i][axis] for i in idx) for axis in range(3))
+        maxs = tuple(max(self.pts[i][axis] for i in idx) for axis in range(3))
+        node = len(self.nodes)
+        self.nodes.append(None)
+        left = right = None
+        if hi - lo > self.LEAF_SIZE:
+            axis = max(range(3), key=lambda a: maxs[a] - mins[a])
+            idx.sort(key=lambda i: self.pts[i][axis])
+            self.order[lo:hi] = idx
+            mid = (lo + hi) // 2
+            left = self._build(lo, mid)
+            right = self._build(mid, hi)
+        self.nodes[node] = (lo, hi, mins, maxs, left, right)
+        return node
+
+    def set_labels(self, label):
+        self.label = label
+        self.node_label = [-1] * len(self.nodes)
+        for node in reversed(range(len(self.nodes))):
+            lo, hi, _, _, left, right = self.nodes[node]
+            if left is None:
+                first = label[self.order[lo]]
+                if all(label[i] == first for i in self.order[lo:hi]):
+                    self.node_label[node] = first
+            elif self.node_label[left] == self.node_label[right]:
+                self.node_label[node] = self.node_label[left]
+
+    def box_d2(self, node, p):
+        """Squared distance from p to the node's bounding box."""
+        _, _, mins, maxs, _, _ = self.nodes[node]
+        return sum(max(mins[a] - p[a], 0, p[a] - maxs[a]) ** 2 for a in range(3))
+
+    def nearest_outside(self, i, best=None):
+        """
+        Smallest pair (squared distance, i, j) from point i to a point of
+        another component, or best if nothing beats it.
+        """
+        p = self.pts[i]
+        own = self.label[i]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self.node_label[node] == own:
+                continue
+            if best is not None and self.box_d2(node, p) > best[0]:
+                continue
+            lo, hi, _, _, left, right = self.nodes[node]
+            if left is None:
+                for j in self.order[lo:hi]:
+                    if self.label[j] != own:
+                        b = self.pts[j]
+                        d2 = (p[0]-b[0])**2 + (p[1]-b[1])**2 + (p[2]-b[2])**2
+                        edge = (d2, i, j) if i < j else (d2, j, i)
+                        if best is None or edge < best:
+                            best = edge
+            elif self.box_d2(left, p) <= self.box_d2(right, p):
+                stack += [right, left]
+            else:
+                stack += [left, right]
+        return best
+
+def last_connection(pts):
+    """
+    The pair whose union connects everything when pairs are joined in
+    order of distance. That is the longest edge of the minimum spanning
+    tree, with ties ordered by (i, j) as the sorted list has them, so the
+    tree is built without listing all pairs:
+    - Kruskal over every pair within a short radius, an exact prefix of
+      the sorted list, joins the dense parts.
+    - Borůvka rounds join the rest: every component but the largest takes
+      its nearest outside pair, which by the cut property is a tree edge.
+    """
+    n = len(pts)
+    if n < 2:
+        return None
+    dsu = DSU(n)
+    longest = None
+    for edge in sorted(candidate_edges(pts, initial_radius(pts, n))):
+        if dsu.union(edge[1], edge[2]):
+            longest = edge
+
+    tree = KDTree(pts) if dsu.components > 1 else None
+    while dsu.components > 1:
+        label = [dsu.find(i) for i in range(n)]
+        tree.set_labels(label)
+        comps = {}
+        for i in range(n):
+            comps.setdefault(label[i], []).append(i)
+        largest = max(comps, key=lambda root: len(comps[root]))
+        chosen = []
+        for root, members in comps.items():
+            if root == largest:
+                continue
+            best = None
+            for i in members:
+                best = tree.nearest_outside(i, best)
+            chosen.append(best)
+        for edge in chosen:
+            if dsu.union(edge[1], edge[2]):
+                longest = edge if longest is None else max(longest, edge)
+    return longest[1], longest[2]
+
+def find_last_connection_product_grid(path="input.txt"):
+    pts = read_points(path)
+    if len(pts) <= 1:
+        print("Not enough points.")
+        return None
+
+    pair = last_connection(pts)
+    if pair is None:
+        print("Warning: graph did not become fully connected.")
+        return None
+
+    i, j = pair
+    product = pts[i][0] * pts[j][0]
+    print("Last connection merged indices:", i, j)
+    print("Coordinates:", pts[i], pts[j])
+    print("Product of X coordinates:", product)
+    return product
+
 def find_last_connection_product(path="input.txt"):
     pts = read_points(path)
     n = len(pts)
@@ -165,5 +282,7 @@ def find_last_connection_product(path="input.txt"):
     return None
 
 if __name__ == "__main__":
-    find_last_connection_product("input.txt")
->>>>>>> e0b85b5 (init)
+    if "--all-pairs" in sys.argv[1:]:
+        find_last_connection_product("input.txt")
+    else:
+        find_last_connection_product_grid("input.txt")